@@ -257,6 +257,64 @@ MIGRATIONS: List[Tuple[str, str, str]] = [
         DROP INDEX IF EXISTS idx_scenario_tags_scenario;
         DROP INDEX IF EXISTS idx_scenario_tags_tag;
     """),
+    
+    # Profile listing support: stored execution counters, tag lookup table
+    # and cohort index (ProfileManager also adds these when it opens a database)
+    ("1.8", "Add profile execution counters, profile_tags and cohort index", """
+        CREATE SEQUENCE IF NOT EXISTS profiles_seq START 1;
+        CREATE TABLE IF NOT EXISTS profiles (
+            id              VARCHAR PRIMARY KEY,
+            name            VARCHAR NOT NULL UNIQUE,
+            description     VARCHAR,
+            version         INTEGER DEFAULT 1,
+            profile_spec    JSON NOT NULL,
+            product         VARCHAR,
+            tags            JSON,
+            created_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            metadata        JSON
+        );
+        CREATE TABLE IF NOT EXISTS profile_executions (
+            id              INTEGER PRIMARY KEY DEFAULT nextval('profiles_seq'),
+            profile_id      VARCHAR NOT NULL REFERENCES profiles(id),
+            cohort_id       VARCHAR REFERENCES cohorts(id),
+            executed_at     TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            seed            INTEGER,
+            count           INTEGER,
+            duration_ms     INTEGER,
+            status          VARCHAR DEFAULT 'completed',
+            error_message   VARCHAR,
+            metadata        JSON
+        );
+        
+        -- Execution counters, backfilled from profile_executions
+        ALTER TABLE profiles ADD COLUMN IF NOT EXISTS execution_count INTEGER DEFAULT 0;
+        ALTER TABLE profiles ADD COLUMN IF NOT EXISTS last_executed TIMESTAMP;
+        UPDATE profiles
+        SET execution_count = e.exec_count,
+            last_executed = e.last_exec
+        FROM (
+            SELECT profile_id, COUNT(*) AS exec_count, MAX(executed_at) AS last_exec
+            FROM profile_executions
+            GROUP BY profile_id
+        ) e
+        WHERE profiles.id = e.profile_id;
+        
+        -- Tag lookup table, backfilled from profiles.tags
+        CREATE TABLE IF NOT EXISTS profile_tags (
+            profile_id      VARCHAR NOT NULL REFERENCES profiles(id),
+            tag             VARCHAR NOT NULL,
+            UNIQUE(profile_id, tag)
+        );
+        INSERT INTO profile_tags (profile_id, tag)
+        SELECT DISTINCT id, unnest(from_json(tags, '["VARCHAR"]'))
+        FROM profiles
+        WHERE tags IS NOT NULL
+        ON CONFLICT DO NOTHING;
+        
+        CREATE INDEX IF NOT EXISTS idx_profile_tags_tag ON profile_tags(tag);
+        CREATE INDEX IF NOT EXISTS idx_profile_executions_cohort ON profile_executions(cohort_id);
+    """),
 ]
 
 
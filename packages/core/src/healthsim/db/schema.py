@@ -9,7 +9,7 @@ from typing import List
 import duckdb
 
 # Current schema version
-SCHEMA_VERSION = "1.7"
+SCHEMA_VERSION = "1.8"
 
 # Standard provenance columns included in all canonical tables
 PROVENANCE_COLUMNS = """
@@ -97,7 +97,9 @@ CREATE TABLE IF NOT EXISTS profiles (
     tags            JSON,                   -- Array of tags for filtering
     created_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    metadata        JSON                    -- Additional metadata
+    metadata        JSON,                   -- Additional metadata
+    execution_count INTEGER DEFAULT 0,      -- Maintained by ProfileManager.record_executions()
+    last_executed   TIMESTAMP               -- Most recent execution time
 );
 """
 
@@ -116,6 +118,14 @@ CREATE TABLE IF NOT EXISTS profile_executions (
 );
 """
 
+PROFILE_TAGS_DDL = """
+CREATE TABLE IF NOT EXISTS profile_tags (
+    profile_id      VARCHAR NOT NULL REFERENCES profiles(id),
+    tag             VARCHAR NOT NULL,
+    UNIQUE(profile_id, tag)
+);
+"""
+
 # ============================================================================
 # JOURNEY MANAGEMENT TABLES
 # ============================================================================
@@ -603,6 +613,10 @@ CREATE INDEX IF NOT EXISTS idx_cohort_entities_cohort ON cohort_entities(cohort_
 CREATE INDEX IF NOT EXISTS idx_cohort_entities_type ON cohort_entities(entity_type);
 CREATE INDEX IF NOT EXISTS idx_cohort_tags_cohort ON cohort_tags(cohort_id);
 CREATE INDEX IF NOT EXISTS idx_cohort_tags_tag ON cohort_tags(tag);
+
+-- Profile lookups
+CREATE INDEX IF NOT EXISTS idx_profile_tags_tag ON profile_tags(tag);
+CREATE INDEX IF NOT EXISTS idx_profile_executions_cohort ON profile_executions(cohort_id);
 """
 
 # ============================================================================
@@ -627,6 +641,7 @@ ALL_DDL = [
     PROFILES_SEQ_DDL,
     PROFILES_DDL,
     PROFILE_EXECUTIONS_DDL,
+    PROFILE_TAGS_DDL,
     
     # Journey management tables
     JOURNEYS_SEQ_DDL,
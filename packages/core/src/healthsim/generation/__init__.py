@@ -105,8 +105,10 @@ from healthsim.generation.cross_domain_sync import (
     TriggerType,
     TriggerSpec,
     TriggerResult,
+    TriggerFailure,
     PersonIdentity,
     IdentityRegistry,
+    Correlators,
     CorrelatorType,
     create_cross_domain_sync,
     hash_ssn,
@@ -265,8 +267,10 @@ __all__ = [
     "TriggerType",
     "TriggerSpec",
     "TriggerResult",
+    "TriggerFailure",
     "PersonIdentity",
     "IdentityRegistry",
+    "Correlators",
     "CorrelatorType",
     "create_cross_domain_sync",
     "hash_ssn",
@@ -14,10 +14,11 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import random
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from enum import Enum
-from typing import Any, Callable, Protocol
+from typing import Any, Callable, Mapping, NamedTuple, Protocol
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -44,6 +45,14 @@ class TriggerType(str, Enum):
     TRIAL_VISIT_TO_ENCOUNTER = "trial_visit_to_encounter"
 
 
+class TriggerFailure(str, Enum):
+    """Reason a trigger did not run its handler."""
+    OK = "ok"
+    NO_SPEC = "no_spec"
+    DISABLED = "disabled"
+    NO_HANDLER = "no_handler"
+
+
 class CorrelatorType(str, Enum):
     """Identity correlation types."""
     SSN = "ssn"
@@ -58,6 +67,41 @@ class CorrelatorType(str, Enum):
 # Identity Correlation
 # =============================================================================
 
+# PersonIdentity attribute holding each product's entity ID
+PRODUCT_ID_FIELDS: dict[ProductType, str] = {
+    ProductType.PATIENTSIM: "patient_id",
+    ProductType.MEMBERSIM: "member_id",
+    ProductType.RXMEMBERSIM: "rx_member_id",
+    ProductType.TRIALSIM: "subject_id",
+}
+
+# Prefix for product IDs minted by CrossDomainSync
+PRODUCT_ID_PREFIXES: dict[ProductType, str] = {
+    ProductType.PATIENTSIM: "PAT-",
+    ProductType.MEMBERSIM: "MEM-",
+    ProductType.RXMEMBERSIM: "RXM-",
+    ProductType.TRIALSIM: "SUBJ-",
+}
+
+
+class Correlators(NamedTuple):
+    """Normalized correlator values used for identity matching."""
+    ssn_hash: str | None
+    dob: str | None
+    gender: str | None
+    name: str | None
+    
+    @classmethod
+    def from_dict(cls, correlators: dict[str, Any]) -> Correlators:
+        """Build from a correlator dict, treating empty values as missing."""
+        return cls(
+            correlators.get("ssn_hash") or None,
+            correlators.get("dob") or None,
+            correlators.get("gender") or None,
+            correlators.get("name") or None,
+        )
+
+
 class PersonIdentity(BaseModel):
     """Core person identity shared across products.
     
@@ -81,15 +125,25 @@ class PersonIdentity(BaseModel):
     rx_member_id: str | None = None  # RxMemberSim
     subject_id: str | None = None  # TrialSim
     
+    @property
+    def name_key(self) -> str | None:
+        """Normalized "LAST,FIRST" key, or None unless both names are set."""
+        if not (self.last_name and self.first_name):
+            return None
+        return f"{self.last_name},{self.first_name}".upper()
+    
+    def to_correlators(self) -> Correlators:
+        """Get correlators for matching as a fixed-field tuple."""
+        return Correlators(
+            ssn_hash=self.ssn_hash,
+            dob=self.date_of_birth.isoformat() if self.date_of_birth else None,
+            gender=self.gender,
+            name=self.name_key,
+        )
+    
     def to_correlator_dict(self) -> dict[str, Any]:
         """Get correlators for matching."""
-        return {
-            "correlation_id": self.correlation_id,
-            "ssn_hash": self.ssn_hash,
-            "dob": self.date_of_birth.isoformat() if self.date_of_birth else None,
-            "gender": self.gender,
-            "name": f"{self.last_name},{self.first_name}".upper() if self.last_name else None,
-        }
+        return {"correlation_id": self.correlation_id, **self.to_correlators()._asdict()}
 
 
 class IdentityRegistry:
@@ -97,11 +151,29 @@ class IdentityRegistry:
     
     Maintains a mapping of person identities across products,
     enabling consistent linking when generating related data.
+    
+    Identities are stored as rows: the identity objects plus parallel
+    correlator columns (SSN hash, DOB, gender, name key) that
+    ``find_matches`` scans without touching the models. Correlators are
+    captured at registration time, so re-register an identity after
+    changing its demographics.
+    
+    Each correlator also has an inverted index (value -> rows), so
+    ``find_matches`` only scores rows that share at least one value
+    with the query.
     """
     
     def __init__(self):
-        self._identities: dict[str, PersonIdentity] = {}
-        self._product_indexes: dict[ProductType, dict[str, str]] = {
+        self._identities: list[PersonIdentity] = []
+        self._ssn_hashes: list[str | None] = []
+        self._dobs: list[str | None] = []
+        self._genders: list[str | None] = []
+        self._name_keys: list[str | None] = []
+        self._rows: dict[str, int] = {}
+        self._correlator_indexes: tuple[dict[str, list[int]], ...] = tuple(
+            {} for _ in Correlators._fields
+        )
+        self._product_indexes: dict[ProductType, dict[str, int]] = {
             p: {} for p in ProductType
         }
     
@@ -114,23 +186,45 @@ class IdentityRegistry:
         Returns:
             Correlation ID
         """
-        self._identities[identity.correlation_id] = identity
+        correlators = identity.to_correlators()
+        ssn_hash, dob, gender, name_key = correlators
+        
+        row = self._rows.get(identity.correlation_id)
+        if row is None:
+            row = len(self._identities)
+            self._rows[identity.correlation_id] = row
+            self._identities.append(identity)
+            self._ssn_hashes.append(ssn_hash)
+            self._dobs.append(dob)
+            self._genders.append(gender)
+            self._name_keys.append(name_key)
+        else:
+            self._unindex_correlators(row)
+            self._identities[row] = identity
+            self._ssn_hashes[row] = ssn_hash
+            self._dobs[row] = dob
+            self._genders[row] = gender
+            self._name_keys[row] = name_key
+        
+        # Index by correlator values
+        for value, index in zip(correlators, self._correlator_indexes):
+            if value:
+                index.setdefault(value, []).append(row)
         
         # Index by product IDs
-        if identity.patient_id:
-            self._product_indexes[ProductType.PATIENTSIM][identity.patient_id] = identity.correlation_id
-        if identity.member_id:
-            self._product_indexes[ProductType.MEMBERSIM][identity.member_id] = identity.correlation_id
-        if identity.rx_member_id:
-            self._product_indexes[ProductType.RXMEMBERSIM][identity.rx_member_id] = identity.correlation_id
-        if identity.subject_id:
-            self._product_indexes[ProductType.TRIALSIM][identity.subject_id] = identity.correlation_id
+        for product, attr in PRODUCT_ID_FIELDS.items():
+            product_id = getattr(identity, attr)
+            if product_id:
+                self._product_indexes[product][product_id] = row
         
         return identity.correlation_id
     
     def get_by_correlation_id(self, correlation_id: str) -> PersonIdentity | None:
         """Get identity by correlation ID."""
-        return self._identities.get(correlation_id)
+        row = self._rows.get(correlation_id)
+        if row is None:
+            return None
+        return self._identities[row]
     
     def get_by_product_id(
         self,
@@ -138,10 +232,11 @@ class IdentityRegistry:
         product_id: str
     ) -> PersonIdentity | None:
         """Get identity by product-specific ID."""
-        correlation_id = self._product_indexes.get(product, {}).get(product_id)
-        if correlation_id:
-            return self._identities.get(correlation_id)
-        return None
+        index = self._product_indexes.get(product)
+        row = index.get(product_id) if index is not None else None
+        if row is None:
+            return None
+        return self._identities[row]
     
     def link_product_id(
         self,
@@ -159,22 +254,24 @@ class IdentityRegistry:
         Returns:
             True if linked successfully
         """
-        identity = self._identities.get(correlation_id)
-        if not identity:
+        row = self._rows.get(correlation_id)
+        if row is None:
             return False
-        
-        # Update identity
-        if product == ProductType.PATIENTSIM:
-            identity.patient_id = product_id
-        elif product == ProductType.MEMBERSIM:
-            identity.member_id = product_id
-        elif product == ProductType.RXMEMBERSIM:
-            identity.rx_member_id = product_id
-        elif product == ProductType.TRIALSIM:
-            identity.subject_id = product_id
+        identity = self._identities[row]
+        index = self._product_indexes[product]
+        attr = PRODUCT_ID_FIELDS.get(product)
+        
+        if attr:
+            # Drop the index entry for any ID this link replaces
+            previous_id = getattr(identity, attr)
+            if previous_id and previous_id != product_id and index.get(previous_id) == row:
+                del index[previous_id]
+            
+            # Update identity
+            setattr(identity, attr, product_id)
         
         # Update index
-        self._product_indexes[product][product_id] = correlation_id
+        index[product_id] = row
         
         return True
     
@@ -192,47 +289,77 @@ class IdentityRegistry:
         Returns:
             List of (identity, confidence) tuples
         """
+        query = Correlators.from_dict(correlators)
         matches = []
         
-        for identity in self._identities.values():
-            score = self._calculate_match_score(identity, correlators)
+        # A row scores above zero only if it shares a correlator value
+        # with the query, so the indexes yield every possible match.
+        if min_confidence > 0:
+            candidates: set[int] = set()
+            for value, index in zip(query, self._correlator_indexes):
+                if value:
+                    candidates.update(index.get(value, ()))
+            rows = sorted(candidates)
+        else:
+            rows = range(len(self._identities))
+        
+        for row in rows:
+            score = self._calculate_match_score(row, query)
             if score >= min_confidence:
-                matches.append((identity, score))
+                matches.append((self._identities[row], score))
         
         return sorted(matches, key=lambda x: x[1], reverse=True)
     
+    def _unindex_correlators(self, row: int) -> None:
+        """Remove a row from the correlator indexes."""
+        values = (
+            self._ssn_hashes[row],
+            self._dobs[row],
+            self._genders[row],
+            self._name_keys[row],
+        )
+        for value, index in zip(values, self._correlator_indexes):
+            if value:
+                rows = index[value]
+                rows.remove(row)
+                if not rows:
+                    del index[value]
+    
     def _calculate_match_score(
         self,
-        identity: PersonIdentity,
-        correlators: dict[str, Any]
+        row: int,
+        query: Correlators
     ) -> float:
-        """Calculate match confidence score."""
+        """Calculate match confidence score for a registry row."""
         total_weight = 0.0
         matched_weight = 0.0
         
         # SSN hash - highest weight
-        if correlators.get("ssn_hash") and identity.ssn_hash:
+        ssn_hash = self._ssn_hashes[row]
+        if query.ssn_hash and ssn_hash:
             total_weight += 1.0
-            if correlators["ssn_hash"] == identity.ssn_hash:
+            if query.ssn_hash == ssn_hash:
                 matched_weight += 1.0
         
         # DOB - high weight
-        if correlators.get("dob") and identity.date_of_birth:
+        dob = self._dobs[row]
+        if query.dob and dob:
             total_weight += 0.5
-            if correlators["dob"] == identity.date_of_birth.isoformat():
+            if query.dob == dob:
                 matched_weight += 0.5
         
         # Gender - low weight
-        if correlators.get("gender") and identity.gender:
+        gender = self._genders[row]
+        if query.gender and gender:
             total_weight += 0.1
-            if correlators["gender"] == identity.gender:
+            if query.gender == gender:
                 matched_weight += 0.1
         
         # Name - medium weight
-        if correlators.get("name") and identity.last_name:
+        name_key = self._name_keys[row]
+        if query.name and name_key:
             total_weight += 0.3
-            identity_name = f"{identity.last_name},{identity.first_name}".upper()
-            if correlators["name"] == identity_name:
+            if query.name == name_key:
                 matched_weight += 0.3
         
         if total_weight == 0:
@@ -242,7 +369,7 @@ class IdentityRegistry:
     
     def get_all(self) -> list[PersonIdentity]:
         """Get all registered identities."""
-        return list(self._identities.values())
+        return list(self._identities)
     
     def count(self) -> int:
         """Get count of registered identities."""
@@ -253,7 +380,7 @@ class IdentityRegistry:
 # Event Triggers
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TriggerSpec:
     """Specification for a cross-product trigger."""
     trigger_type: TriggerType
@@ -275,6 +402,24 @@ class TriggerResult:
     success: bool
     message: str = ""
     generated_data: dict[str, Any] = field(default_factory=dict)
+    code: TriggerFailure = TriggerFailure.OK
+    
+    def describe(self) -> str:
+        """The result's message, or the standard text for its failure code.
+        
+        fire() leaves message empty for failure codes; the text is only
+        formatted here, for callers that report it.
+        """
+        if self.message or self.code is TriggerFailure.OK:
+            return self.message
+        return _TRIGGER_FAILURE_MESSAGES[self.code].format(trigger_type=self.trigger_type)
+
+
+_TRIGGER_FAILURE_MESSAGES: dict[TriggerFailure, str] = {
+    TriggerFailure.NO_SPEC: "No spec registered for {trigger_type}",
+    TriggerFailure.DISABLED: "Trigger {trigger_type} is disabled",
+    TriggerFailure.NO_HANDLER: "No handler registered for {trigger_type}",
+}
 
 
 class TriggerHandler(Protocol):
@@ -291,15 +436,20 @@ class TriggerHandler(Protocol):
 
 
 class TriggerRegistry:
-    """Registry for cross-product trigger handlers."""
+    """Registry for cross-product trigger handlers.
+    
+    Registration is copy-on-write: each call builds a new mapping and
+    swaps it in with a single assignment, so ``fire`` can run from
+    multiple threads without locking and never sees a partial update.
+    """
     
     def __init__(self):
-        self._handlers: dict[TriggerType, TriggerHandler] = {}
-        self._specs: dict[TriggerType, TriggerSpec] = {}
+        self._handlers: Mapping[TriggerType, TriggerHandler] = {}
+        self._specs: Mapping[TriggerType, TriggerSpec] = {}
     
     def register_spec(self, spec: TriggerSpec) -> None:
         """Register a trigger specification."""
-        self._specs[spec.trigger_type] = spec
+        self._specs = {**self._specs, spec.trigger_type: spec}
     
     def register_handler(
         self,
@@ -307,7 +457,7 @@ class TriggerRegistry:
         handler: TriggerHandler
     ) -> None:
         """Register a handler for a trigger type."""
-        self._handlers[trigger_type] = handler
+        self._handlers = {**self._handlers, trigger_type: handler}
     
     def get_spec(self, trigger_type: TriggerType) -> TriggerSpec | None:
         """Get trigger specification."""
@@ -337,40 +487,28 @@ class TriggerRegistry:
         handler = self._handlers.get(trigger_type)
         
         if not spec:
-            return TriggerResult(
-                trigger_type=trigger_type,
-                source_id=source_event.get("id", "unknown"),
-                target_id=None,
-                success=False,
-                message=f"No spec registered for {trigger_type}"
-            )
-        
-        if not spec.enabled:
-            return TriggerResult(
-                trigger_type=trigger_type,
-                source_id=source_event.get("id", "unknown"),
-                target_id=None,
-                success=False,
-                message=f"Trigger {trigger_type} is disabled"
-            )
-        
-        if not handler:
-            return TriggerResult(
-                trigger_type=trigger_type,
-                source_id=source_event.get("id", "unknown"),
-                target_id=None,
-                success=False,
-                message=f"No handler registered for {trigger_type}"
-            )
-        
-        return handler.handle(source_event, spec, context or {})
+            code = TriggerFailure.NO_SPEC
+        elif not spec.enabled:
+            code = TriggerFailure.DISABLED
+        elif not handler:
+            code = TriggerFailure.NO_HANDLER
+        else:
+            return handler.handle(source_event, spec, context or {})
+        
+        return TriggerResult(
+            trigger_type=trigger_type,
+            source_id=source_event.get("id", "unknown"),
+            target_id=None,
+            success=False,
+            code=code,
+        )
 
 
 # =============================================================================
 # Cross-Domain Sync Coordinator
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SyncConfig:
     """Configuration for cross-domain sync."""
     auto_generate_claims: bool = True
@@ -382,6 +520,29 @@ class SyncConfig:
     prefer_real_npis: bool = True
 
 
+_SYNC_REPORT_TEMPLATE = "\n".join([
+    "═" * 67,
+    "                    CROSS-DOMAIN SYNC REPORT",
+    "═" * 67,
+    "",
+    "Products: {products}",
+    "",
+    "IDENTITY CORRELATION",
+    "─" * 67,
+    "Identities correlated: {identities_correlated}",
+    "",
+    "EVENT SYNCHRONIZATION",
+    "─" * 67,
+    "Triggers fired: {triggers_fired}",
+    "Succeeded: {triggers_succeeded}",
+    "Failed: {triggers_failed}",
+    "",
+    "VALIDATION",
+    "─" * 67,
+    "Status: {status}",
+])
+
+
 @dataclass
 class SyncReport:
     """Report from cross-domain sync operation."""
@@ -397,27 +558,14 @@ class SyncReport:
     
     def to_formatted_string(self) -> str:
         """Format report for display."""
-        lines = [
-            "═" * 67,
-            "                    CROSS-DOMAIN SYNC REPORT",
-            "═" * 67,
-            "",
-            f"Products: {', '.join(p.value for p in self.products)}",
-            "",
-            "IDENTITY CORRELATION",
-            "─" * 67,
-            f"Identities correlated: {self.identities_correlated}",
-            "",
-            "EVENT SYNCHRONIZATION",
-            "─" * 67,
-            f"Triggers fired: {self.triggers_fired}",
-            f"Succeeded: {self.triggers_succeeded}",
-            f"Failed: {self.triggers_failed}",
-            "",
-            "VALIDATION",
-            "─" * 67,
-            f"Status: {'✓ Pass' if self.validation_passed else '✗ Fail'}",
-        ]
+        lines = [_SYNC_REPORT_TEMPLATE.format_map({
+            "products": ", ".join(p.value for p in self.products),
+            "identities_correlated": self.identities_correlated,
+            "triggers_fired": self.triggers_fired,
+            "triggers_succeeded": self.triggers_succeeded,
+            "triggers_failed": self.triggers_failed,
+            "status": "✓ Pass" if self.validation_passed else "✗ Fail",
+        })]
         
         if self.validation_warnings:
             lines.append(f"Warnings: {len(self.validation_warnings)}")
@@ -533,12 +681,48 @@ class CrossDomainSync:
         Returns:
             PersonIdentity with linked product IDs
         """
-        import random
         rng = random.Random(seed or self.seed)
+        identity = self._build_linked_identity(products, demographics, rng)
+        self.identity_registry.register(identity)
+        
+        return identity
+    
+    def create_linked_identities(
+        self,
+        products: list[ProductType],
+        demographics: list[dict[str, Any]],
+        seed: int | None = None
+    ) -> list[PersonIdentity]:
+        """Create a batch of person identities linked across products.
+        
+        A single RNG stream is shared across the batch, so the first
+        identity matches ``create_linked_identity`` with the same seed.
         
-        # Generate correlation ID
-        correlation_id = str(uuid4())
+        Args:
+            products: Products to generate IDs for
+            demographics: Demographics for each person
+            seed: Seed for ID generation
+            
+        Returns:
+            PersonIdentities with linked product IDs, in input order
+        """
+        rng = random.Random(seed or self.seed)
+        identities = [
+            self._build_linked_identity(products, person, rng)
+            for person in demographics
+        ]
+        for identity in identities:
+            self.identity_registry.register(identity)
         
+        return identities
+    
+    def _build_linked_identity(
+        self,
+        products: list[ProductType],
+        demographics: dict[str, Any],
+        rng: random.Random
+    ) -> PersonIdentity:
+        """Build an unregistered identity with product IDs drawn from rng."""
         # Hash SSN if provided
         ssn_hash = None
         if demographics.get("ssn"):
@@ -547,7 +731,6 @@ class CrossDomainSync:
             ).hexdigest()[:16]
         
         identity = PersonIdentity(
-            correlation_id=correlation_id,
             ssn_hash=ssn_hash,
             date_of_birth=demographics.get("date_of_birth"),
             gender=demographics.get("gender"),
@@ -556,19 +739,10 @@ class CrossDomainSync:
         )
         
         # Generate product-specific IDs
-        if ProductType.PATIENTSIM in products:
-            identity.patient_id = f"PAT-{rng.randint(10000000, 99999999)}"
-        
-        if ProductType.MEMBERSIM in products:
-            identity.member_id = f"MEM-{rng.randint(10000000, 99999999)}"
-        
-        if ProductType.RXMEMBERSIM in products:
-            identity.rx_member_id = f"RXM-{rng.randint(10000000, 99999999)}"
-        
-        if ProductType.TRIALSIM in products:
-            identity.subject_id = f"SUBJ-{rng.randint(10000000, 99999999)}"
-        
-        self.identity_registry.register(identity)
+        for product, attr in PRODUCT_ID_FIELDS.items():
+            if product in products:
+                prefix = PRODUCT_ID_PREFIXES[product]
+                setattr(identity, attr, f"{prefix}{rng.randint(10000000, 99999999)}")
         
         return identity
     
@@ -602,6 +776,9 @@ class CrossDomainSync:
         Returns:
             Tuple of (passed, errors, warnings)
         """
+        if not entities:
+            return True, [], []
+        
         errors = []
         warnings = []
         
@@ -718,6 +895,6 @@ def hash_ssn(ssn: str) -> str:
     Returns:
         Hashed value
     """
-    # Remove non-digits
-    digits = "".join(c for c in ssn if c.isdigit())
+    # Remove non-digits; filter() keeps the per-character test in C
+    digits = "".join(filter(str.isdigit, ssn))
     return hashlib.sha256(digits.encode()).hexdigest()[:16]
@@ -34,6 +34,18 @@ from healthsim.generation.journey_engine import (
 # Base Handler Infrastructure
 # =============================================================================
 
+def _key_rng(rng: random.Random, seed: int | None, entity_id: str, event_id: str) -> None:
+    """Reseed rng from the seed, entity and event.
+    
+    Keys each event's draws to the event itself, so a handler returns the
+    same values whether or not other events were executed before it.
+    Unseeded handlers keep drawing from their unkeyed RNG.
+    """
+    if seed is not None:
+        combined = f"{seed}:{entity_id}:{event_id}"
+        rng.seed(int(hashlib.md5(combined.encode()).hexdigest()[:8], 16))
+
+
 class BaseEventHandler(ABC):
     """Base class for event handlers with common utilities."""
     
@@ -125,6 +137,7 @@ class PatientSimHandlers:
     ) -> dict[str, Any]:
         """Handle patient admission event."""
         patient_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, patient_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         encounter_id = self._generate_id("ENC", patient_id, event.timeline_event_id)
@@ -177,6 +190,7 @@ class PatientSimHandlers:
     ) -> dict[str, Any]:
         """Handle outpatient encounter event."""
         patient_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, patient_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         encounter_id = self._generate_id("ENC", patient_id, event.timeline_event_id)
@@ -223,6 +237,7 @@ class PatientSimHandlers:
     ) -> dict[str, Any]:
         """Handle laboratory order event."""
         patient_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, patient_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         order_id = self._generate_id("ORD", patient_id, event.timeline_event_id)
@@ -247,6 +262,7 @@ class PatientSimHandlers:
     ) -> dict[str, Any]:
         """Handle laboratory result event."""
         patient_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, patient_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         result_id = self._generate_id("RES", patient_id, event.timeline_event_id)
@@ -315,6 +331,7 @@ class PatientSimHandlers:
     ) -> dict[str, Any]:
         """Handle medication order event."""
         patient_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, patient_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         order_id = self._generate_id("MED", patient_id, event.timeline_event_id)
@@ -341,6 +358,7 @@ class PatientSimHandlers:
     ) -> dict[str, Any]:
         """Handle procedure event."""
         patient_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, patient_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         procedure_id = self._generate_id("PROC", patient_id, event.timeline_event_id)
@@ -431,6 +449,7 @@ class MemberSimHandlers:
     ) -> dict[str, Any]:
         """Handle new enrollment event."""
         member_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, member_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         enrollment_id = self._generate_id("ENR", member_id, event.timeline_event_id)
@@ -471,6 +490,7 @@ class MemberSimHandlers:
     ) -> dict[str, Any]:
         """Handle plan change event."""
         member_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, member_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         new_plan = self._select_plan(params.get("new_plan_type"))
@@ -495,6 +515,7 @@ class MemberSimHandlers:
     ) -> dict[str, Any]:
         """Handle professional claim event."""
         member_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, member_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         claim_id = self._generate_id("CLM", member_id, event.timeline_event_id)
@@ -527,6 +548,7 @@ class MemberSimHandlers:
     ) -> dict[str, Any]:
         """Handle institutional claim event."""
         member_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, member_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         claim_id = self._generate_id("CLM", member_id, event.timeline_event_id)
@@ -560,6 +582,7 @@ class MemberSimHandlers:
     ) -> dict[str, Any]:
         """Handle pharmacy claim event."""
         member_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, member_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         claim_id = self._generate_id("RX", member_id, event.timeline_event_id)
@@ -724,6 +747,7 @@ class RxMemberSimHandlers:
     ) -> dict[str, Any]:
         """Handle prescription fill event."""
         member_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, member_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         fill_id = self._generate_id("FILL", member_id, event.timeline_event_id)
@@ -751,6 +775,7 @@ class RxMemberSimHandlers:
     ) -> dict[str, Any]:
         """Handle prescription refill event."""
         member_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, member_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         fill_id = self._generate_id("FILL", member_id, event.timeline_event_id)
@@ -965,6 +990,7 @@ class TrialSimHandlers:
     ) -> dict[str, Any]:
         """Handle screening visit event."""
         subject_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, subject_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         screening_id = self._generate_id("SCR", subject_id, event.timeline_event_id)
@@ -992,6 +1018,7 @@ class TrialSimHandlers:
     ) -> dict[str, Any]:
         """Handle randomization event."""
         subject_id = self._get_entity_id(entity)
+        _key_rng(self._rng, self.seed, subject_id, event.timeline_event_id)
         params = event.result.get("parameters", {}) if event.result else {}
         
         randomization_id = self._generate_id("RND", subject_id, event.timeline_event_id)
@@ -1223,14 +1250,31 @@ def create_trialsim_handlers(seed: int | None = None) -> TrialSimHandlers:
     return TrialSimHandlers(seed)
 
 
-def register_all_handlers(engine: JourneyEngine, seed: int | None = None) -> None:
-    """Register all product handlers with an engine.
+# Handler collection for each product, in registration order
+_PRODUCT_HANDLERS: dict[str, type] = {
+    "patientsim": PatientSimHandlers,
+    "membersim": MemberSimHandlers,
+    "rxmembersim": RxMemberSimHandlers,
+    "trialsim": TrialSimHandlers,
+}
+
+
+def register_all_handlers(
+    engine: JourneyEngine,
+    seed: int | None = None,
+    products: list[str] | None = None,
+) -> None:
+    """Register product handlers with an engine.
     
     Args:
         engine: JourneyEngine to register handlers with
         seed: Random seed for handlers
+        products: Products to register handlers for (default: all)
+        
+    Raises:
+        ValueError: If a product has no handlers
     """
-    PatientSimHandlers(seed).register_all(engine)
-    MemberSimHandlers(seed).register_all(engine)
-    RxMemberSimHandlers(seed).register_all(engine)
-    TrialSimHandlers(seed).register_all(engine)
+    for product in products if products is not None else _PRODUCT_HANDLERS:
+        if product not in _PRODUCT_HANDLERS:
+            raise ValueError(f"Unknown product: {product}")
+        _PRODUCT_HANDLERS[product](seed).register_all(engine)
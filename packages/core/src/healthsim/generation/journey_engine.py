@@ -12,13 +12,16 @@ The journey engine follows a timeline-based approach:
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import random
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import date, datetime, timedelta
 from enum import Enum
+from operator import attrgetter
 from typing import Any, Protocol
 
 from pydantic import BaseModel, Field
@@ -163,18 +166,19 @@ class DelaySpec(BaseModel):
     
     def to_timedelta(self, seed: int | None = None) -> timedelta:
         """Convert to actual timedelta, applying randomization if needed."""
-        rng = random.Random(seed) if seed else random.Random()
-        
         if self.distribution == "fixed":
             return timedelta(days=self.days)
         
+        # Only randomized delays pay for seeding an RNG
         elif self.distribution == "uniform":
+            rng = random.Random(seed) if seed else random.Random()
             min_days = self.days_min if self.days_min is not None else self.days
             max_days = self.days_max if self.days_max is not None else self.days
             actual_days = rng.randint(min_days, max_days)
             return timedelta(days=actual_days)
         
         elif self.distribution == "normal":
+            rng = random.Random(seed) if seed else random.Random()
             # Use days as mean, (max-min)/4 as std_dev
             mean = self.days
             std_dev = (self.days_max - self.days_min) / 4 if self.days_min and self.days_max else 2
@@ -352,7 +356,7 @@ class JourneySpecification(BaseModel):
 # Timeline Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TimelineEvent:
     """A scheduled event on a timeline."""
     
@@ -382,9 +386,23 @@ class TimelineEvent:
     triggered_events: list[str] = field(default_factory=list)
 
 
+_scheduled_date = attrgetter("scheduled_date")
+
+
+def _dataclass_values(obj: Any) -> dict[str, Any]:
+    """Field values of a dataclass, including slotted ones without __dict__."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
 @dataclass 
 class Timeline:
-    """Timeline of events for an entity."""
+    """Timeline of events for an entity.
+    
+    ``events`` is kept sorted by scheduled date, which get_events_up_to()
+    relies on. Events passed to the constructor are sorted on creation;
+    add events afterwards with add_event() or add_events() rather than
+    appending to the list directly.
+    """
     
     entity_id: str
     entity_type: str  # "patient", "member", "rx_member", etc.
@@ -397,11 +415,20 @@ class Timeline:
     # Cross-product correlation
     linked_timelines: dict[str, str] = field(default_factory=dict)  # product -> timeline_id
     
+    def __post_init__(self) -> None:
+        """Put constructor-supplied events in date order."""
+        self.events.sort(key=_scheduled_date)
+    
     def add_event(self, event: TimelineEvent) -> None:
         """Add event to timeline, maintaining chronological order."""
         self.events.append(event)
         self.events.sort(key=lambda e: e.scheduled_date)
     
+    def add_events(self, events: list[TimelineEvent]) -> None:
+        """Add several events, sorting once instead of after each one."""
+        self.events.extend(events)
+        self.events.sort(key=lambda e: e.scheduled_date)
+    
     def get_pending_events(self) -> list[TimelineEvent]:
         """Get all pending events in chronological order."""
         return [e for e in self.events if e.status == "pending"]
@@ -412,10 +439,9 @@ class Timeline:
     
     def get_events_up_to(self, target_date: date) -> list[TimelineEvent]:
         """Get pending events up to and including target date."""
-        return [
-            e for e in self.events 
-            if e.status == "pending" and e.scheduled_date <= target_date
-        ]
+        # Events are kept in date order, so only the due prefix is scanned
+        due = bisect_right(self.events, target_date, key=_scheduled_date)
+        return [e for e in self.events[:due] if e.status == "pending"]
     
     def mark_executed(self, event_id: str, result: dict[str, Any]) -> None:
         """Mark an event as executed with result."""
@@ -515,6 +541,26 @@ class JourneyEngine:
         """
         self._trigger_handlers[target_product] = handler
     
+    def fork(self) -> JourneyEngine:
+        """Return a copy of this engine with its handlers but fresh state.
+        
+        The copy has the same seed, a newly seeded RNG and no active
+        timelines, so it draws exactly as a freshly built engine would
+        without registering every handler again. Handlers registered on
+        the copy do not affect this engine.
+        
+        Returns:
+            The new engine
+        """
+        engine = copy.copy(self)
+        engine._rng = random.Random(self.seed)
+        engine._handlers = {
+            product: dict(handlers) for product, handlers in self._handlers.items()
+        }
+        engine._trigger_handlers = dict(self._trigger_handlers)
+        engine._active_timelines = {}
+        return engine
+    
     def create_timeline(
         self,
         entity: Any,
@@ -550,8 +596,9 @@ class JourneyEngine:
         # Build context for condition evaluation
         context = self._build_context(entity, entity_type, parameters or {})
         
-        # Schedule events
+        # Schedule events; the timeline is sorted once after the loop
         scheduled_events: dict[str, date] = {}
+        timeline_events: list[TimelineEvent] = []
         current_date = timeline_start
         
         for event_def in journey.events:
@@ -589,16 +636,18 @@ class JourneyEngine:
                 parameters=event_def.parameters.copy(),  # Store original params
             )
             
-            timeline.add_event(timeline_event)
+            timeline_events.append(timeline_event)
             scheduled_events[event_def.event_id] = event_date
             
             # Update current_date for non-dependent events
             if not event_def.depends_on:
                 current_date = event_date
         
+        timeline.add_events(timeline_events)
+        
         # Set end date
         if timeline.events:
-            timeline.end_date = max(e.scheduled_date for e in timeline.events)
+            timeline.end_date = timeline.events[-1].scheduled_date
         
         # Register as active timeline
         self._active_timelines[timeline.entity_id] = timeline
@@ -628,11 +677,11 @@ class JourneyEngine:
         event_type = event.event_type
         
         # Find handler
-        if product not in self._handlers or event_type not in self._handlers[product]:
+        product_handlers = self._handlers.get(product)
+        handler = product_handlers.get(event_type) if product_handlers else None
+        if handler is None:
             return {"status": "skipped", "reason": f"No handler for {product}/{event_type}"}
         
-        handler = self._handlers[product][event_type]
-        
         try:
             # Resolve skill references in parameters
             entity_dict = self._entity_to_dict(entity)
@@ -667,6 +716,10 @@ class JourneyEngine:
             return entity.model_dump()
         if hasattr(entity, "dict"):
             return entity.dict()
+        # Dataclasses first: a plain subclass of a slotted dataclass has a
+        # __dict__ holding only its own fields
+        if is_dataclass(entity):
+            return _dataclass_values(entity)
         if hasattr(entity, "__dict__"):
             return entity.__dict__
         return {}
@@ -795,15 +848,57 @@ class JourneyEngine:
         
         for event in timeline.get_events_up_to(target_date):
             result = self.execute_event(timeline, event, entity, context)
-            results.append({
-                "event_id": event.timeline_event_id,
-                "event_type": event.event_type,
-                "scheduled_date": event.scheduled_date.isoformat(),
-                **result,
-            })
+            results.append(self._timeline_result(event, result))
         
         return results
     
+    def execute_timelines(
+        self,
+        timelines: list[tuple[Timeline, Any]],
+        up_to_date: date | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Execute pending events across several timelines in date order.
+        
+        Events from all timelines are interleaved by scheduled date; events
+        on the same date keep timeline order. As with execute_timeline(),
+        the due events are collected once up front, so events added to a
+        timeline while these run (e.g. by triggers) wait for a later call.
+        
+        Args:
+            timelines: (timeline, entity) pairs to execute
+            up_to_date: Execute events up to this date
+            context: Additional context
+            
+        Returns:
+            Execution results for each timeline, in the order given
+        """
+        target_date = up_to_date or date.max
+        results: list[list[dict[str, Any]]] = [[] for _ in timelines]
+        
+        due = [
+            (event, index)
+            for index, (timeline, _) in enumerate(timelines)
+            for event in timeline.get_events_up_to(target_date)
+        ]
+        due.sort(key=lambda item: item[0].scheduled_date)
+        
+        for event, index in due:
+            timeline, entity = timelines[index]
+            result = self.execute_event(timeline, event, entity, context)
+            results[index].append(self._timeline_result(event, result))
+        
+        return results
+    
+    def _timeline_result(self, event: TimelineEvent, result: dict[str, Any]) -> dict[str, Any]:
+        """Build the execute_timeline entry for an executed event."""
+        return {
+            "event_id": event.timeline_event_id,
+            "event_type": event.event_type,
+            "scheduled_date": event.scheduled_date.isoformat(),
+            **result,
+        }
+    
     def _process_triggers(
         self,
         event: TimelineEvent,
@@ -828,7 +923,9 @@ class JourneyEngine:
         }
         
         # Extract entity attributes if available
-        if hasattr(entity, "__dict__"):
+        if is_dataclass(entity):
+            context["entity"] = _dataclass_values(entity)
+        elif hasattr(entity, "__dict__"):
             context["entity"] = entity.__dict__
         elif hasattr(entity, "dict"):
             context["entity"] = entity.dict()
@@ -225,8 +225,7 @@ class ProfileJourneyOrchestrator:
                     start_date=timeline_start,
                 )
                 # Merge events into combined timeline
-                for event in timeline.events:
-                    combined_timeline.add_event(event)
+                combined_timeline.add_events(timeline.events)
             
             # Optionally execute events
             if execute_events and combined_timeline.events:
@@ -10,7 +10,10 @@ it produces identical output.
 
 from __future__ import annotations
 
+import os
 import random
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from typing import Any
@@ -33,6 +36,9 @@ from healthsim.generation.profile_schema import (
     ProfileSpecification,
 )
 
+# Below this many entities execute_parallel() generates in-process; starting
+# worker processes and pickling results costs more than it saves
+PARALLEL_MIN_COUNT = 1000
 
 
 class HierarchicalSeedManager:
@@ -64,10 +70,14 @@ class HierarchicalSeedManager:
             Seed value for this entity
         """
         if entity_index not in self._entity_seeds:
-            # Generate seeds sequentially to ensure determinism
+            # Generate seeds sequentially to ensure determinism. This is the
+            # rejection loop randint(0, 2**31 - 1) runs, minus its call overhead
+            getrandbits = self._master_rng.getrandbits
             while len(self._entity_seeds) <= entity_index:
-                idx = len(self._entity_seeds)
-                self._entity_seeds[idx] = self._master_rng.randint(0, 2**31 - 1)
+                seed = getrandbits(32)
+                while seed >= 2**31:
+                    seed = getrandbits(32)
+                self._entity_seeds[len(self._entity_seeds)] = seed
         return self._entity_seeds[entity_index]
 
     def get_entity_rng(self, entity_index: int) -> random.Random:
@@ -88,7 +98,7 @@ class HierarchicalSeedManager:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedEntity:
     """A single generated entity with all attributes."""
 
@@ -196,6 +206,10 @@ class ProfileExecutor:
         self.seed = seed or profile.generation.seed or random.randint(0, 2**31 - 1)
         self.seed_manager = HierarchicalSeedManager(self.seed)
         self._reference_data: dict[str, Any] = {}
+        # Distributions built from each spec, keyed by id(spec)
+        self._distributions: dict[
+            int, tuple[DistributionSpec, Any, ConditionalDistribution | None]
+        ] = {}
 
     def execute(
         self,
@@ -211,18 +225,66 @@ class ProfileExecutor:
         Returns:
             ExecutionResult with generated entities and validation
         """
-        import time
         start_time = time.time()
 
-        count = count_override or self.profile.generation.count
-        if dry_run:
-            count = min(count, 5)  # Sample only
+        count = self._resolve_count(count_override, dry_run)
 
         entities: list[GeneratedEntity] = []
         for i in range(count):
             entity = self._generate_entity(i)
             entities.append(entity)
 
+        return self._build_result(entities, start_time)
+
+    def execute_parallel(
+        self,
+        max_workers: int | None = None,
+        count_override: int | None = None,
+        dry_run: bool = False,
+    ) -> ExecutionResult:
+        """Execute the profile, generating entities across worker processes.
+
+        Each entity depends only on its own hierarchical seed, so the
+        entities are identical to those from execute(). Batches smaller
+        than PARALLEL_MIN_COUNT are generated in-process.
+
+        Args:
+            max_workers: Worker processes to use (defaults to CPU count)
+            count_override: Override the count from profile
+            dry_run: If True, generate sample only
+
+        Returns:
+            ExecutionResult with generated entities and validation
+        """
+        start_time = time.time()
+
+        count = self._resolve_count(count_override, dry_run)
+        workers = max_workers or os.cpu_count() or 1
+        if count < PARALLEL_MIN_COUNT or workers < 2:
+            return self.execute(count_override=count_override, dry_run=dry_run)
+
+        chunk_size = -(-count // workers)
+        starts = range(0, count, chunk_size)
+        stops = [min(start + chunk_size, count) for start in starts]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(_generate_entity_range, [self] * len(starts), starts, stops)
+            entities = [entity for chunk in chunks for entity in chunk]
+
+        return self._build_result(entities, start_time)
+
+    def _resolve_count(self, count_override: int | None, dry_run: bool) -> int:
+        """Number of entities to generate."""
+        count = count_override or self.profile.generation.count
+        if dry_run:
+            count = min(count, 5)  # Sample only
+        return count
+
+    def _build_result(
+        self,
+        entities: list[GeneratedEntity],
+        start_time: float,
+    ) -> ExecutionResult:
+        """Validate generated entities and wrap them in an ExecutionResult."""
         duration = time.time() - start_time
         validation = self._validate(entities)
 
@@ -235,7 +297,6 @@ class ProfileExecutor:
             duration_seconds=duration,
         )
 
-
     def _generate_entity(self, index: int) -> GeneratedEntity:
         """Generate a single entity at the given index.
 
@@ -378,6 +439,28 @@ class ProfileExecutor:
             entity.plan_type = self._sample_distribution(coverage.plan_type, rng)
 
 
+    def _distribution_for(
+        self,
+        dist_spec: DistributionSpec,
+    ) -> tuple[DistributionSpec, Any, ConditionalDistribution | None]:
+        """Build the distributions for a spec once, rather than per sample.
+
+        The spec itself is kept in the entry so a recycled id() never
+        returns another spec's distribution.
+        """
+        entry = self._distributions.get(id(dist_spec))
+        if entry is None or entry[0] is not dist_spec:
+            cond_dist = None
+            if dist_spec.type == DistributionType.CONDITIONAL:
+                cond_dist = ConditionalDistribution(
+                    rules=dist_spec.rules or [],
+                    default=dist_spec.default,
+                )
+            dist = create_distribution(dist_spec.model_dump(exclude_none=True))
+            entry = (dist_spec, dist, cond_dist)
+            self._distributions[id(dist_spec)] = entry
+        return entry
+
     def _sample_distribution(
         self,
         dist_spec: DistributionSpec,
@@ -396,15 +479,10 @@ class ProfileExecutor:
         Returns:
             Sampled value
         """
-        spec_dict = dist_spec.model_dump(exclude_none=True)
-        dist = create_distribution(spec_dict)
+        _, dist, cond_dist = self._distribution_for(dist_spec)
 
         # Handle conditional distributions
-        if dist_spec.type == DistributionType.CONDITIONAL and context:
-            cond_dist = ConditionalDistribution(
-                rules=dist_spec.rules or [],
-                default=dist_spec.default,
-            )
+        if cond_dist is not None and context:
             value = cond_dist.sample(context, rng)
         else:
             value = dist.sample(rng)
@@ -556,6 +634,15 @@ class ProfileExecutor:
                 ))
 
 
+def _generate_entity_range(
+    executor: ProfileExecutor,
+    start: int,
+    stop: int,
+) -> list[GeneratedEntity]:
+    """Generate entities [start, stop) in an execute_parallel() worker."""
+    return [executor._generate_entity(i) for i in range(start, stop)]
+
+
 def execute_profile(
     profile: ProfileSpecification | dict[str, Any] | str,
     seed: int | None = None,
@@ -212,7 +212,7 @@ class TriggerRegistry:
 # Cross-Product Coordinator
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LinkedEntity:
     """An entity with cross-product linkage."""
     
@@ -277,17 +277,14 @@ class CrossProductCoordinator:
         Returns:
             LinkedEntity instance
         """
-        linked = LinkedEntity(core_id=core_id)
-        
-        if product_ids:
-            if "patient_id" in product_ids:
-                linked.patient_id = product_ids["patient_id"]
-            if "member_id" in product_ids:
-                linked.member_id = product_ids["member_id"]
-            if "rx_member_id" in product_ids:
-                linked.rx_member_id = product_ids["rx_member_id"]
-            if "trial_subject_id" in product_ids:
-                linked.trial_subject_id = product_ids["trial_subject_id"]
+        product_ids = product_ids or {}
+        linked = LinkedEntity(
+            core_id=core_id,
+            patient_id=product_ids.get("patient_id"),
+            member_id=product_ids.get("member_id"),
+            rx_member_id=product_ids.get("rx_member_id"),
+            trial_subject_id=product_ids.get("trial_subject_id"),
+        )
         
         self._linked_entities[core_id] = linked
         return linked
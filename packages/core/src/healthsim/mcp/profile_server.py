@@ -61,12 +61,29 @@ PROFILES_DIR = Path.home() / ".healthsim" / "profiles"
 JOURNEYS_DIR = Path.home() / ".healthsim" / "journeys"
 
 
+# Responses for list_profiles / list_journeys when nothing is saved
+EMPTY_PROFILES_MESSAGE = "No saved profiles found.\n\nUse `build_profile` to create one."
+EMPTY_JOURNEYS_MESSAGE = "No saved journeys found.\n\nUse `build_journey` to create one."
+
+
 def ensure_storage_dirs():
     """Ensure storage directories exist."""
     PROFILES_DIR.mkdir(parents=True, exist_ok=True)
     JOURNEYS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _write_if_changed(filepath: Path, content: str) -> bool:
+    """Write content to filepath unless the file already holds it.
+    
+    Returns:
+        True if the file was written
+    """
+    if filepath.exists() and filepath.read_text() == content:
+        return False
+    filepath.write_text(content)
+    return True
+
+
 # =============================================================================
 # Profile Formatters
 # =============================================================================
@@ -122,15 +139,14 @@ def format_profile_summary(profile: ProfileSpecification) -> str:
 def format_profile_list(profiles: list[dict]) -> str:
     """Format list of profiles for display."""
     if not profiles:
-        return "No saved profiles found.\n\nUse `build_profile` to create one."
+        return EMPTY_PROFILES_MESSAGE
     
     lines = ["**Saved Profiles:**", ""]
     
     for p in profiles:
-        line = f"- **{p['name']}** (`{p['id']}`)"
+        lines.append(f"- **{p['name']}** (`{p['id']}`)")
         if p.get("description"):
-            line += f"\n  _{p['description']}_"
-        lines.append(line)
+            lines.append(f"  _{p['description']}_")
     
     return "\n".join(lines)
 
@@ -176,6 +192,19 @@ def format_execution_result(result: ExecutionResult) -> str:
 # Journey Formatters
 # =============================================================================
 
+# Events listed individually in a journey summary before truncating
+MAX_SUMMARY_EVENTS = 8
+
+
+def _format_event_line(evt: dict) -> str:
+    """Format one journey event as a summary bullet."""
+    evt_name = evt.get("name", evt.get("event_type", "Event"))
+    evt_type = evt.get("event_type", "")
+    if evt_type and evt_type != evt_name:
+        return f"- {evt_name} ({evt_type})"
+    return f"- {evt_name}"
+
+
 def format_journey_summary(journey: dict) -> str:
     """Format a journey specification for display."""
     lines = [
@@ -207,15 +236,9 @@ def format_journey_summary(journey: dict) -> str:
     if events:
         lines.append("")
         lines.append(f"**Events ({len(events)}):**")
-        for evt in events[:8]:
-            evt_name = evt.get("name", evt.get("event_type", "Event"))
-            evt_type = evt.get("event_type", "")
-            if evt_type and evt_type != evt_name:
-                lines.append(f"- {evt_name} ({evt_type})")
-            else:
-                lines.append(f"- {evt_name}")
-        if len(events) > 8:
-            lines.append(f"- ... and {len(events) - 8} more")
+        lines.extend(_format_event_line(evt) for evt in events[:MAX_SUMMARY_EVENTS])
+        if len(events) > MAX_SUMMARY_EVENTS:
+            lines.append(f"- ... and {len(events) - MAX_SUMMARY_EVENTS} more")
     
     # Parameters
     params = journey.get("parameters", {})
@@ -229,7 +252,7 @@ def format_journey_summary(journey: dict) -> str:
 def format_journey_list(journeys: list[dict]) -> str:
     """Format list of journeys for display."""
     if not journeys:
-        return "No saved journeys found.\n\nUse `build_journey` to create one."
+        return EMPTY_JOURNEYS_MESSAGE
     
     lines = ["**Saved Journeys:**", ""]
     
@@ -249,10 +272,10 @@ def format_journey_list(journeys: list[dict]) -> str:
         
         if details:
             line += f" - {', '.join(details)}"
+        lines.append(line)
         
         if j.get("description"):
-            line += f"\n  _{j['description']}_"
-        lines.append(line)
+            lines.append(f"  _{j['description']}_")
     
     return "\n".join(lines)
 
@@ -595,7 +618,7 @@ async def handle_save_profile(arguments: dict) -> list[TextContent]:
             text=format_error(f"Profile exists: {profile.id}. Use overwrite=true.")
         )]
     
-    filepath.write_text(profile.to_json())
+    _write_if_changed(filepath, profile.to_json())
     
     return [TextContent(type="text", text=format_success(f"Saved: {profile.name} ({filepath})"))]
 
@@ -789,7 +812,7 @@ async def handle_save_journey(arguments: dict) -> list[TextContent]:
             text=format_error(f"Journey exists: {journey_id}. Use overwrite=true.")
         )]
     
-    filepath.write_text(json.dumps(journey, indent=2, default=str))
+    _write_if_changed(filepath, json.dumps(journey, indent=2, default=str))
     
     journey_name = journey.get("name", journey_id)
     return [TextContent(type="text", text=format_success(f"Saved: {journey_name} ({filepath})"))]
@@ -6,15 +6,15 @@ enabling reusable profile definitions and execution history tracking.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 import json
-import time
+import secrets
 
 import duckdb
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileRecord:
     """A saved profile specification."""
     id: str
@@ -29,7 +29,7 @@ class ProfileRecord:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionRecord:
     """Record of a profile execution."""
     id: int
@@ -44,7 +44,7 @@ class ExecutionRecord:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileSummary:
     """Summary of a profile for listing."""
     id: str
@@ -58,6 +58,161 @@ class ProfileSummary:
     last_executed: Optional[datetime] = None
 
 
+def _new_profile_id() -> str:
+    """Return a random "profile-" + 8 hex char ID."""
+    return f"profile-{secrets.token_hex(4)}"
+
+
+# =============================================================================
+# SQL Statements
+# =============================================================================
+# Built once at import so every call binds parameters to the same text.
+
+_PROFILE_ID_BY_NAME_OR_ID_SQL = """
+    SELECT id FROM profiles WHERE name = ? OR id = ? LIMIT 1
+"""
+
+# Returns no row when the name is already taken
+_INSERT_PROFILE_SQL = """
+    INSERT INTO profiles (id, name, description, version, profile_spec, product, tags, metadata)
+    VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+    ON CONFLICT (name) DO NOTHING
+    RETURNING id
+"""
+
+_SELECT_PROFILE_SQL = """
+    SELECT id, name, description, version, profile_spec, product, tags, 
+           created_at, updated_at, metadata
+    FROM profiles
+    WHERE name = ? OR id = ?
+"""
+
+_DELETE_PROFILE_EXECUTIONS_SQL = "DELETE FROM profile_executions WHERE profile_id = ?"
+
+_HAS_PROFILE_EXECUTIONS_SQL = "SELECT 1 FROM profile_executions WHERE profile_id = ? LIMIT 1"
+
+_DELETE_PROFILE_SQL = "DELETE FROM profiles WHERE id = ?"
+
+_INSERT_PROFILE_TAGS_SQL = "INSERT INTO profile_tags (profile_id, tag) SELECT ?, unnest(?)"
+
+_DELETE_PROFILE_TAGS_SQL = "DELETE FROM profile_tags WHERE profile_id = ?"
+
+_COUNT_EXECUTIONS_SQL = """
+    UPDATE profiles
+    SET execution_count = COALESCE(profiles.execution_count, 0) + e.exec_count,
+        last_executed = greatest(profiles.last_executed, e.last_exec)
+    FROM (
+        SELECT profile_id, COUNT(*) AS exec_count, MAX(executed_at) AS last_exec
+        FROM profile_executions
+        WHERE id = ANY(?)
+        GROUP BY profile_id
+    ) e
+    WHERE profiles.id = e.profile_id
+"""
+
+_SELECT_EXECUTIONS_SQL = """
+    SELECT id, profile_id, cohort_id, executed_at, seed, count, 
+           duration_ms, status, error_message, metadata
+    FROM profile_executions
+    WHERE profile_id = (SELECT id FROM profiles WHERE name = ? OR id = ? LIMIT 1)
+    ORDER BY executed_at DESC, id DESC
+    LIMIT ?
+"""
+
+_COHORT_PROFILE_SQL = """
+    SELECT p.id, p.name, p.description, p.version, p.profile_spec, p.product, p.tags, 
+           p.created_at, p.updated_at, p.metadata
+    FROM profile_executions e
+    JOIN profiles p ON e.profile_id = p.id
+    WHERE e.cohort_id = ?
+    LIMIT 1
+"""
+
+_EXECUTION_SPEC_SQL = """
+    SELECT e.seed, e.count, p.profile_spec
+    FROM profile_executions e
+    JOIN profiles p ON e.profile_id = p.id
+    WHERE e.id = ?
+"""
+
+
+def _build_list_profiles_sql(by_product: bool, by_search: bool, by_tags: bool) -> str:
+    """Build the list_profiles query for one combination of filters."""
+    query = """
+        SELECT p.id, p.name, p.description, p.version, p.product, p.tags, p.created_at,
+               p.execution_count, p.last_executed
+        FROM profiles p
+        WHERE 1=1
+    """
+    if by_product:
+        query += " AND p.product = ?"
+    if by_search:
+        # Literal, case-insensitive substring match (no LIKE pattern parsing)
+        query += " AND (contains(lower(p.name), ?) OR contains(lower(p.description), ?))"
+    if by_tags:
+        query += " AND p.id IN (SELECT profile_id FROM profile_tags WHERE tag = ANY(?))"
+    query += " ORDER BY p.updated_at DESC"
+    query += " LIMIT ?"
+    return query
+
+
+# Keyed by (filter by product, filter by search, filter by tags)
+_LIST_PROFILES_SQL = {
+    (by_product, by_search, by_tags): _build_list_profiles_sql(by_product, by_search, by_tags)
+    for by_product in (False, True)
+    for by_search in (False, True)
+    for by_tags in (False, True)
+}
+
+# Rows fetched per round trip while iter_profiles() streams a listing
+_LIST_PROFILES_BATCH = 100
+
+
+@lru_cache(maxsize=32)
+def _insert_executions_sql(row_count: int) -> str:
+    """Multi-row INSERT ... RETURNING for a batch of row_count executions."""
+    placeholders = ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?)"] * row_count)
+    return f"""
+        INSERT INTO profile_executions 
+        (profile_id, cohort_id, seed, count, duration_ms, status, error_message, metadata)
+        VALUES {placeholders}
+        RETURNING id
+    """
+
+
+@lru_cache(maxsize=32)
+def _update_profile_sql(columns: tuple, bump_version: bool) -> str:
+    """UPDATE touching only the given columns (each bound as a parameter)."""
+    assignments = [f"{column} = ?" for column in columns]
+    if bump_version:
+        assignments.append("version = version + 1")
+    assignments.append("updated_at = CURRENT_TIMESTAMP")
+    return f"UPDATE profiles SET {', '.join(assignments)} WHERE id = ?"
+
+
+def _execution_params(
+    profile_id: str,
+    cohort_id: Optional[str] = None,
+    seed: Optional[int] = None,
+    count: int = 0,
+    duration_ms: int = 0,
+    status: str = "completed",
+    error_message: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> List[Any]:
+    """Build the INSERT parameters for one profile_executions row."""
+    return [
+        profile_id,
+        cohort_id,
+        seed,
+        count,
+        duration_ms,
+        status,
+        error_message,
+        json.dumps(metadata) if metadata else None
+    ]
+
+
 class ProfileManager:
     """Manages profile persistence in DuckDB.
     
@@ -124,7 +279,9 @@ class ProfileManager:
                     tags            JSON,
                     created_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    metadata        JSON
+                    metadata        JSON,
+                    execution_count INTEGER DEFAULT 0,
+                    last_executed   TIMESTAMP
                 )
             """)
             self.conn.execute("""
@@ -141,6 +298,62 @@ class ProfileManager:
                     metadata        JSON
                 )
             """)
+        
+        # Cohort lookups for get_cohort_profile()
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_profile_executions_cohort
+            ON profile_executions(cohort_id)
+        """)
+        
+        # Execution counters, backfilled on databases created before them
+        result = self.conn.execute("""
+            SELECT COUNT(*) FROM information_schema.columns 
+            WHERE table_name = 'profiles' AND column_name = 'execution_count'
+        """).fetchone()
+        
+        if result[0] == 0:
+            self.conn.execute("""
+                ALTER TABLE profiles ADD COLUMN execution_count INTEGER DEFAULT 0
+            """)
+            self.conn.execute("""
+                ALTER TABLE profiles ADD COLUMN last_executed TIMESTAMP
+            """)
+            self.conn.execute("""
+                UPDATE profiles
+                SET execution_count = e.exec_count,
+                    last_executed = e.last_exec
+                FROM (
+                    SELECT profile_id, COUNT(*) AS exec_count, MAX(executed_at) AS last_exec
+                    FROM profile_executions
+                    GROUP BY profile_id
+                ) e
+                WHERE profiles.id = e.profile_id
+            """)
+        
+        # Tag lookup table, backfilled from profiles.tags on databases
+        # created before it existed
+        result = self.conn.execute("""
+            SELECT COUNT(*) FROM information_schema.tables 
+            WHERE table_name = 'profile_tags'
+        """).fetchone()
+        
+        if result[0] == 0:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS profile_tags (
+                    profile_id      VARCHAR NOT NULL,
+                    tag             VARCHAR NOT NULL,
+                    UNIQUE(profile_id, tag)
+                )
+            """)
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_profile_tags_tag ON profile_tags(tag)
+            """)
+            self.conn.execute("""
+                INSERT INTO profile_tags (profile_id, tag)
+                SELECT DISTINCT id, unnest(from_json(tags, '["VARCHAR"]'))
+                FROM profiles
+                WHERE tags IS NOT NULL
+            """)
     
     # =========================================================================
     # Profile CRUD Operations
@@ -171,25 +384,14 @@ class ProfileManager:
         Raises:
             ValueError: If profile with name already exists
         """
-        profile_id = f"profile-{uuid4().hex[:8]}"
-        
-        # Check for existing profile with same name
-        existing = self.conn.execute(
-            "SELECT id FROM profiles WHERE name = ?",
-            [name]
-        ).fetchone()
-        
-        if existing:
-            raise ValueError(f"Profile with name '{name}' already exists. Use update_profile() or delete first.")
+        profile_id = _new_profile_id()
         
         # Infer product from profile_spec if not provided
         if not product:
             product = profile_spec.get("profile", {}).get("product")
         
-        self.conn.execute("""
-            INSERT INTO profiles (id, name, description, version, profile_spec, product, tags, metadata)
-            VALUES (?, ?, ?, 1, ?, ?, ?, ?)
-        """, [
+        # The UNIQUE(name) constraint doubles as the duplicate check
+        inserted = self.conn.execute(_INSERT_PROFILE_SQL, [
             profile_id,
             name,
             description,
@@ -197,7 +399,12 @@ class ProfileManager:
             product,
             json.dumps(tags or []),
             json.dumps(metadata) if metadata else None
-        ])
+        ]).fetchone()
+        
+        if not inserted:
+            raise ValueError(f"Profile with name '{name}' already exists. Use update_profile() or delete first.")
+        
+        self._insert_tags(profile_id, tags)
         
         return profile_id
     
@@ -213,27 +420,27 @@ class ProfileManager:
         Raises:
             ValueError: If profile not found
         """
-        result = self.conn.execute("""
-            SELECT id, name, description, version, profile_spec, product, tags, 
-                   created_at, updated_at, metadata
-            FROM profiles
-            WHERE name = ? OR id = ?
-        """, [name_or_id, name_or_id]).fetchone()
+        result = self.conn.execute(_SELECT_PROFILE_SQL, [name_or_id, name_or_id]).fetchone()
         
         if not result:
             raise ValueError(f"Profile not found: {name_or_id}")
         
+        return self._profile_record(result)
+    
+    @staticmethod
+    def _profile_record(row: tuple) -> ProfileRecord:
+        """Build a ProfileRecord, decoding JSON columns afresh for each caller."""
         return ProfileRecord(
-            id=result[0],
-            name=result[1],
-            description=result[2],
-            version=result[3],
-            profile_spec=json.loads(result[4]) if isinstance(result[4], str) else result[4],
-            product=result[5],
-            tags=json.loads(result[6]) if isinstance(result[6], str) else (result[6] or []),
-            created_at=result[7],
-            updated_at=result[8],
-            metadata=json.loads(result[9]) if result[9] and isinstance(result[9], str) else result[9]
+            id=row[0],
+            name=row[1],
+            description=row[2],
+            version=row[3],
+            profile_spec=json.loads(row[4]) if isinstance(row[4], str) else row[4],
+            product=row[5],
+            tags=json.loads(row[6]) if isinstance(row[6], str) else (row[6] or []),
+            created_at=row[7],
+            updated_at=row[8],
+            metadata=json.loads(row[9]) if row[9] and isinstance(row[9], str) else row[9]
         )
     
     def update_profile(
@@ -261,33 +468,30 @@ class ProfileManager:
         Raises:
             ValueError: If profile not found
         """
-        # Load existing profile
         existing = self.load_profile(name_or_id)
         
-        # Build update
-        new_version = existing.version + 1 if bump_version else existing.version
-        new_spec = profile_spec if profile_spec is not None else existing.profile_spec
-        new_desc = description if description is not None else existing.description
-        new_tags = tags if tags is not None else existing.tags
-        new_metadata = metadata if metadata is not None else existing.metadata
-        
-        self.conn.execute("""
-            UPDATE profiles
-            SET profile_spec = ?,
-                description = ?,
-                version = ?,
-                tags = ?,
-                metadata = ?,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, [
-            json.dumps(new_spec),
-            new_desc,
-            new_version,
-            json.dumps(new_tags),
-            json.dumps(new_metadata) if new_metadata else None,
-            existing.id
-        ])
+        # Only write the columns that were given; an unchanged spec is
+        # neither re-serialized nor rewritten
+        changes: Dict[str, Any] = {}
+        if profile_spec is not None:
+            changes["profile_spec"] = json.dumps(profile_spec)
+        if description is not None:
+            changes["description"] = description
+        if tags is not None:
+            changes["tags"] = json.dumps(tags)
+        if metadata is not None:
+            changes["metadata"] = json.dumps(metadata) if metadata else None
+        
+        if not changes and not bump_version:
+            return existing
+        
+        self.conn.execute(
+            _update_profile_sql(tuple(changes), bump_version),
+            [*changes.values(), existing.id],
+        )
+        if tags is not None:
+            self.conn.execute(_DELETE_PROFILE_TAGS_SQL, [existing.id])
+            self._insert_tags(existing.id, tags)
         
         return self.load_profile(existing.id)
     
@@ -301,27 +505,35 @@ class ProfileManager:
         Returns:
             True if deleted, False if not found
         """
-        # Get profile ID
-        result = self.conn.execute("""
-            SELECT id FROM profiles WHERE name = ? OR id = ?
-        """, [name_or_id, name_or_id]).fetchone()
+        # Resolve a single profile, so a name that equals another
+        # profile's ID never deletes both
+        result = self.conn.execute(
+            _PROFILE_ID_BY_NAME_OR_ID_SQL, [name_or_id, name_or_id]
+        ).fetchone()
         
         if not result:
             return False
         
         profile_id = result[0]
         
-        # Delete executions if requested
         if delete_executions:
-            self.conn.execute(
-                "DELETE FROM profile_executions WHERE profile_id = ?",
-                [profile_id]
-            )
-        
-        # Delete profile
-        self.conn.execute("DELETE FROM profiles WHERE id = ?", [profile_id])
+            self.conn.execute(_DELETE_PROFILE_EXECUTIONS_SQL, [profile_id])
+        elif self.conn.execute(_HAS_PROFILE_EXECUTIONS_SQL, [profile_id]).fetchone():
+            # Kept executions may block the delete through a foreign key;
+            # try the profile row first so a failure leaves its tags intact
+            self.conn.execute(_DELETE_PROFILE_SQL, [profile_id])
+            self.conn.execute(_DELETE_PROFILE_TAGS_SQL, [profile_id])
+            return True
+        
+        self.conn.execute(_DELETE_PROFILE_TAGS_SQL, [profile_id])
+        self.conn.execute(_DELETE_PROFILE_SQL, [profile_id])
         return True
     
+    def _insert_tags(self, profile_id: str, tags: Optional[List[str]]) -> None:
+        """Index a profile's tags in profile_tags."""
+        if tags:
+            self.conn.execute(_INSERT_PROFILE_TAGS_SQL, [profile_id, list(dict.fromkeys(tags))])
+    
     def list_profiles(
         self,
         product: Optional[str] = None,
@@ -340,52 +552,66 @@ class ProfileManager:
         Returns:
             List of ProfileSummary objects
         """
-        query = """
-            SELECT p.id, p.name, p.description, p.version, p.product, p.tags, p.created_at,
-                   COUNT(e.id) as exec_count,
-                   MAX(e.executed_at) as last_exec
-            FROM profiles p
-            LEFT JOIN profile_executions e ON p.id = e.profile_id
-            WHERE 1=1
+        return list(self.iter_profiles(product=product, tags=tags, search=search, limit=limit))
+    
+    def iter_profiles(
+        self,
+        product: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+    ) -> Iterator[ProfileSummary]:
+        """Yield profile summaries one at a time; see list_profiles().
+        
+        Rows are fetched from the connection in batches as the iterator
+        advances, so run no other query on this manager's connection
+        until it is exhausted.
+        
+        Args:
+            product: Filter by product type
+            tags: Filter by tags (any match)
+            search: Search in name and description
+            limit: Maximum results
+            
+        Yields:
+            ProfileSummary objects, most recently updated first
         """
-        params = []
+        query = _LIST_PROFILES_SQL[bool(product), bool(search), bool(tags)]
+        params: List[Any] = []
         
         if product:
-            query += " AND p.product = ?"
             params.append(product)
         
         if search:
-            query += " AND (p.name ILIKE ? OR p.description ILIKE ?)"
-            params.extend([f"%{search}%", f"%{search}%"])
+            needle = search.lower()
+            params.extend([needle, needle])
         
-        query += " GROUP BY p.id, p.name, p.description, p.version, p.product, p.tags, p.created_at, p.updated_at"
-        query += " ORDER BY p.updated_at DESC"
-        query += f" LIMIT {limit}"
+        if tags:
+            params.append(list(tags))
         
-        results = self.conn.execute(query, params).fetchall()
+        params.append(limit)
         
-        summaries = []
-        for row in results:
-            profile_tags = json.loads(row[5]) if isinstance(row[5], str) else (row[5] or [])
-            
-            # Filter by tags if requested
-            if tags:
-                if not any(t in profile_tags for t in tags):
-                    continue
-            
-            summaries.append(ProfileSummary(
-                id=row[0],
-                name=row[1],
-                description=row[2],
-                version=row[3],
-                product=row[4],
-                tags=profile_tags,
-                created_at=row[6],
-                execution_count=row[7] or 0,
-                last_executed=row[8]
-            ))
-        
-        return summaries
+        cursor = self.conn.execute(query, params)
+        
+        while rows := cursor.fetchmany(_LIST_PROFILES_BATCH):
+            yield from map(self._profile_summary, rows)
+    
+    @staticmethod
+    def _profile_summary(row: tuple) -> ProfileSummary:
+        """Build a ProfileSummary from a listing row."""
+        profile_tags = json.loads(row[5]) if isinstance(row[5], str) else (row[5] or [])
+        
+        return ProfileSummary(
+            id=row[0],
+            name=row[1],
+            description=row[2],
+            version=row[3],
+            product=row[4],
+            tags=profile_tags,
+            created_at=row[6],
+            execution_count=row[7] or 0,
+            last_executed=row[8]
+        )
     
     # =========================================================================
     # Execution History
@@ -417,23 +643,42 @@ class ProfileManager:
         Returns:
             Execution ID
         """
-        result = self.conn.execute("""
-            INSERT INTO profile_executions 
-            (profile_id, cohort_id, seed, count, duration_ms, status, error_message, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            RETURNING id
-        """, [
-            profile_id,
-            cohort_id,
-            seed,
-            count,
-            duration_ms,
-            status,
-            error_message,
-            json.dumps(metadata) if metadata else None
-        ]).fetchone()
+        return self.record_executions([{
+            "profile_id": profile_id,
+            "cohort_id": cohort_id,
+            "seed": seed,
+            "count": count,
+            "duration_ms": duration_ms,
+            "status": status,
+            "error_message": error_message,
+            "metadata": metadata,
+        }])[0]
+    
+    def record_executions(self, executions: List[Dict[str, Any]]) -> List[int]:
+        """Record several profile executions with a single INSERT.
+        
+        Args:
+            executions: One dict of record_execution() arguments per execution
+            
+        Returns:
+            Execution IDs, in the order given
+        """
+        if not executions:
+            return []
+        
+        params: List[Any] = []
+        for execution in executions:
+            params.extend(_execution_params(**execution))
+        
+        results = self.conn.execute(
+            _insert_executions_sql(len(executions)), params
+        ).fetchall()
+        execution_ids = [row[0] for row in results]
+        
+        # Keep the per-profile counters read by list_profiles() current
+        self.conn.execute(_COUNT_EXECUTIONS_SQL, [execution_ids])
         
-        return result[0]
+        return execution_ids
     
     def get_executions(
         self,
@@ -449,31 +694,23 @@ class ProfileManager:
         Returns:
             List of ExecutionRecords, newest first
         """
-        # Resolve profile ID
-        profile = self.load_profile(profile_id)
-        
-        results = self.conn.execute("""
-            SELECT id, profile_id, cohort_id, executed_at, seed, count, 
-                   duration_ms, status, error_message, metadata
-            FROM profile_executions
-            WHERE profile_id = ?
-            ORDER BY executed_at DESC
-            LIMIT ?
-        """, [profile.id, limit]).fetchall()
-        
+        # Resolves the name or ID in the same statement
+        results = self.conn.execute(
+            _SELECT_EXECUTIONS_SQL, [profile_id, profile_id, limit]
+        ).fetchall()
+        
+        # No rows: distinguish "no executions yet" from an unknown profile
+        if not results and not self.conn.execute(
+            _PROFILE_ID_BY_NAME_OR_ID_SQL, [profile_id, profile_id]
+        ).fetchone():
+            raise ValueError(f"Profile not found: {profile_id}")
+        
+        # Columns are selected in field order, so rows map positionally;
+        # only rows carrying JSON metadata need decoding
         return [
-            ExecutionRecord(
-                id=row[0],
-                profile_id=row[1],
-                cohort_id=row[2],
-                executed_at=row[3],
-                seed=row[4],
-                count=row[5],
-                duration_ms=row[6],
-                status=row[7],
-                error_message=row[8],
-                metadata=json.loads(row[9]) if row[9] and isinstance(row[9], str) else row[9]
-            )
+            ExecutionRecord(*row[:9], json.loads(row[9]))
+            if row[9] and isinstance(row[9], str)
+            else ExecutionRecord(*row)
             for row in results
         ]
     
@@ -486,14 +723,13 @@ class ProfileManager:
         Returns:
             ProfileRecord if cohort was generated from a profile, None otherwise
         """
-        result = self.conn.execute("""
-            SELECT profile_id FROM profile_executions WHERE cohort_id = ?
-        """, [cohort_id]).fetchone()
+        # One indexed lookup fetches the whole profile row
+        result = self.conn.execute(_COHORT_PROFILE_SQL, [cohort_id]).fetchone()
         
         if not result:
             return None
         
-        return self.load_profile(result[0])
+        return self._profile_record(result)
     
     # =========================================================================
     # Re-execution Support
@@ -513,12 +749,7 @@ class ProfileManager:
         Returns:
             Profile spec with seed applied
         """
-        result = self.conn.execute("""
-            SELECT e.seed, e.count, p.profile_spec
-            FROM profile_executions e
-            JOIN profiles p ON e.profile_id = p.id
-            WHERE e.id = ?
-        """, [execution_id]).fetchone()
+        result = self.conn.execute(_EXECUTION_SPEC_SQL, [execution_id]).fetchone()
         
         if not result:
             raise ValueError(f"Execution not found: {execution_id}")
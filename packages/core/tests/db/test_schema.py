@@ -5,6 +5,7 @@ import pytest
 import duckdb
 
 from healthsim.db.connection import DatabaseConnection, get_connection
+from healthsim.db.migrations import run_migrations
 from healthsim.db.schema import (
     apply_schema,
     SCHEMA_VERSION,
@@ -165,6 +166,49 @@ class TestIndexCreation:
         assert result is not None
 
 
+class TestProfileMigration:
+    """Tests for the 1.8 profile-listing migration."""
+    
+    def test_migrates_1_7_profile_tables(self, tmp_path):
+        """Test a 1.7 database gains execution counters and backfilled tags."""
+        conn = duckdb.connect(str(tmp_path / "old.duckdb"))
+        conn.execute("""
+            CREATE TABLE schema_migrations (
+                version VARCHAR PRIMARY KEY,
+                description VARCHAR,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            INSERT INTO schema_migrations (version, description) VALUES ('1.7', 'Initial');
+            CREATE TABLE cohorts (id VARCHAR PRIMARY KEY);
+            CREATE SEQUENCE profiles_seq START 1;
+            CREATE TABLE profiles (
+                id VARCHAR PRIMARY KEY, name VARCHAR NOT NULL UNIQUE, description VARCHAR,
+                version INTEGER DEFAULT 1, profile_spec JSON NOT NULL, product VARCHAR,
+                tags JSON, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, metadata JSON
+            );
+            CREATE TABLE profile_executions (
+                id INTEGER PRIMARY KEY DEFAULT nextval('profiles_seq'),
+                profile_id VARCHAR NOT NULL REFERENCES profiles(id),
+                cohort_id VARCHAR REFERENCES cohorts(id),
+                executed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                seed INTEGER, count INTEGER, duration_ms INTEGER,
+                status VARCHAR DEFAULT 'completed', error_message VARCHAR, metadata JSON
+            );
+            INSERT INTO profiles (id, name, profile_spec, tags)
+            VALUES ('profile-1', 'old', '{}', '["diabetes", "senior"]');
+            INSERT INTO profile_executions (profile_id) VALUES ('profile-1'), ('profile-1');
+        """)
+        
+        assert run_migrations(conn) == [SCHEMA_VERSION]
+        
+        assert conn.execute("SELECT execution_count FROM profiles").fetchone()[0] == 2
+        tags = conn.execute("SELECT tag FROM profile_tags ORDER BY tag").fetchall()
+        assert [row[0] for row in tags] == ["diabetes", "senior"]
+        assert run_migrations(conn) == []
+        conn.close()
+
+
 class TestTableHelpers:
     """Tests for table helper functions."""
     
@@ -1,6 +1,7 @@
 """Tests for cross-domain synchronization."""
 
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import date
 
 from healthsim.generation.cross_domain_sync import (
@@ -8,9 +9,11 @@ from healthsim.generation.cross_domain_sync import (
     SyncConfig,
     PersonIdentity,
     IdentityRegistry,
+    Correlators,
     TriggerRegistry,
     TriggerSpec,
     TriggerResult,
+    TriggerFailure,
     TriggerType,
     ProductType,
     CorrelatorType,
@@ -66,6 +69,28 @@ class TestPersonIdentity:
         assert correlators["name"] == "DOE,JOHN"
 
 
+    def test_to_correlators(self):
+        """Test conversion to correlator tuple."""
+        identity = PersonIdentity(
+            ssn_hash="abc123",
+            date_of_birth=date(1965, 3, 15),
+            first_name="John",
+            last_name="Doe",
+        )
+        
+        correlators = identity.to_correlators()
+        
+        assert correlators == Correlators("abc123", "1965-03-15", None, "DOE,JOHN")
+        assert correlators.name == identity.to_correlator_dict()["name"]
+
+
+    def test_name_key_requires_both_names(self):
+        """Test the name correlator is only set with first and last name."""
+        assert PersonIdentity(first_name="John", last_name="Doe").name_key == "DOE,JOHN"
+        assert PersonIdentity(last_name="Doe").name_key is None
+        assert PersonIdentity(last_name="Doe").to_correlator_dict()["name"] is None
+
+
 class TestIdentityRegistry:
     """Tests for IdentityRegistry."""
 
@@ -82,6 +107,19 @@ class TestIdentityRegistry:
         assert correlation_id == identity.correlation_id
         assert registry.count() == 1
 
+    def test_register_same_identity_twice(self):
+        """Test re-registering an identity updates it in place."""
+        registry = IdentityRegistry()
+        identity = PersonIdentity(patient_id="PAT-001", ssn_hash="abc123")
+        registry.register(identity)
+        
+        identity.ssn_hash = "def456"
+        registry.register(identity)
+        
+        assert registry.count() == 1
+        assert len(registry.find_matches({"ssn_hash": "def456"})) == 1
+        assert len(registry.find_matches({"ssn_hash": "abc123"})) == 0
+
     def test_get_by_correlation_id(self):
         """Test retrieving by correlation ID."""
         registry = IdentityRegistry()
@@ -133,6 +171,21 @@ class TestIdentityRegistry:
         assert result.patient_id == "PAT-001"
         assert result.member_id == "MEM-002"
 
+    def test_link_product_id_replaces_old_id(self):
+        """Test relinking a product ID drops the old index entry."""
+        registry = IdentityRegistry()
+        identity = PersonIdentity(member_id="MEM-001")
+        registry.register(identity)
+        
+        registry.link_product_id(
+            identity.correlation_id,
+            ProductType.MEMBERSIM,
+            "MEM-002"
+        )
+        
+        assert registry.get_by_product_id(ProductType.MEMBERSIM, "MEM-001") is None
+        assert registry.get_by_product_id(ProductType.MEMBERSIM, "MEM-002") is identity
+
     def test_find_matches_exact_ssn(self):
         """Test finding matches by SSN hash."""
         registry = IdentityRegistry()
@@ -164,6 +217,35 @@ class TestIdentityRegistry:
         
         assert len(matches) == 0
 
+    def test_find_matches_partial_correlators(self):
+        """Test matching only scores identities sharing a correlator."""
+        registry = IdentityRegistry()
+        jane = PersonIdentity(
+            first_name="Jane",
+            last_name="Smith",
+            date_of_birth=date(1970, 5, 20),
+            gender="F",
+        )
+        john = PersonIdentity(
+            first_name="John",
+            last_name="Doe",
+            date_of_birth=date(1965, 3, 15),
+            gender="M",
+        )
+        registry.register(jane)
+        registry.register(john)
+        
+        matches = registry.find_matches(
+            {"dob": "1970-05-20", "name": "SMITH,JANE", "gender": "M"},
+            min_confidence=0.8
+        )
+        
+        assert [m[0] for m in matches] == [jane]
+        assert matches[0][1] == pytest.approx(0.8 / 0.9)
+        
+        # Zero threshold still returns every identity
+        assert len(registry.find_matches({"gender": "F"}, min_confidence=0.0)) == 2
+
     def test_get_all(self):
         """Test getting all identities."""
         registry = IdentityRegistry()
@@ -215,7 +297,8 @@ class TestTriggerRegistry:
         )
         
         assert result.success is False
-        assert "No handler" in result.message
+        assert result.code == TriggerFailure.NO_HANDLER
+        assert "No handler" in result.describe()
 
     def test_fire_disabled_trigger(self):
         """Test firing a disabled trigger."""
@@ -236,7 +319,34 @@ class TestTriggerRegistry:
         )
         
         assert result.success is False
-        assert "disabled" in result.message
+        assert result.code == TriggerFailure.DISABLED
+        assert "disabled" in result.describe()
+
+    def test_fire_without_spec(self):
+        """Test firing an unregistered trigger."""
+        registry = TriggerRegistry()
+        
+        result = registry.fire(
+            TriggerType.PRESCRIPTION_TO_FILL,
+            {"id": "RX-001"}
+        )
+        
+        assert result.success is False
+        assert result.source_id == "RX-001"
+        assert result.code == TriggerFailure.NO_SPEC
+        assert result.describe() == f"No spec registered for {TriggerType.PRESCRIPTION_TO_FILL}"
+
+    def test_describe_uses_handler_message(self):
+        """Test describe() reports a handler-supplied message as is."""
+        result = TriggerResult(
+            trigger_type=TriggerType.ENCOUNTER_TO_CLAIM,
+            source_id="ENC-001",
+            target_id="CLM-001",
+            success=True,
+            message="Claim generated",
+        )
+        
+        assert result.describe() == "Claim generated"
 
 
 class TestCrossDomainSync:
@@ -297,6 +407,8 @@ class TestCrossDomainSync:
         
         assert identity.ssn_hash is not None
         assert len(identity.ssn_hash) == 16
+        # Hashed as given, separators included, so stored hashes stay valid
+        assert identity.ssn_hash == "01a54629efb95228"
 
     def test_create_multiple_linked_identities(self):
         """Test creating multiple linked identities."""
@@ -311,6 +423,27 @@ class TestCrossDomainSync:
         
         assert sync.identity_registry.count() == 5
 
+    def test_create_linked_identities_batch(self):
+        """Test creating a batch of linked identities."""
+        sync = CrossDomainSync(seed=42)
+        
+        identities = sync.create_linked_identities(
+            products=[ProductType.PATIENTSIM, ProductType.RXMEMBERSIM],
+            demographics=[{"first_name": f"Person{i}"} for i in range(5)],
+        )
+        
+        assert [i.first_name for i in identities] == [f"Person{i}" for i in range(5)]
+        assert len({i.patient_id for i in identities}) == 5
+        assert all(i.rx_member_id and i.member_id is None for i in identities)
+        assert sync.identity_registry.count() == 5
+        
+        # First identity matches the single-identity path with the same seed
+        single = CrossDomainSync(seed=42).create_linked_identity(
+            products=[ProductType.PATIENTSIM, ProductType.RXMEMBERSIM],
+            demographics={"first_name": "Person0"},
+        )
+        assert identities[0].patient_id == single.patient_id
+
     def test_default_triggers_registered(self):
         """Test that default triggers are registered."""
         sync = CrossDomainSync()
@@ -421,3 +554,10 @@ class TestSyncConfig:
         assert config.auto_generate_claims is False
         assert config.claim_delay_days == (2, 7)
         assert config.refill_window_days == 14
+
+    def test_config_is_immutable(self):
+        """Test configuration cannot be mutated after creation."""
+        config = SyncConfig()
+        
+        with pytest.raises(FrozenInstanceError):
+            config.auto_generate_claims = False
@@ -29,6 +29,7 @@ from healthsim.generation.journey_engine import (
     get_journey_template,
     JOURNEY_TEMPLATES,
 )
+from healthsim.generation.profile_executor import GeneratedEntity
 
 
 # =============================================================================
@@ -422,6 +423,24 @@ class TestTimeline:
         
         assert timeline.events[0].scheduled_date < timeline.events[1].scheduled_date
 
+    def test_add_events_sorted_chronologically(self):
+        """Test adding several events keeps date order and ties stable."""
+        timeline = Timeline(entity_id="P001", entity_type="patient")
+        
+        timeline.add_events([
+            TimelineEvent(
+                timeline_event_id=event_id, journey_id="j1", event_definition_id=event_id,
+                scheduled_date=scheduled, event_type="encounter", event_name=event_id
+            )
+            for event_id, scheduled in [
+                ("te1", date(2024, 3, 1)),
+                ("te2", date(2024, 1, 1)),
+                ("te3", date(2024, 3, 1)),
+            ]
+        ])
+        
+        assert [e.timeline_event_id for e in timeline.events] == ["te2", "te1", "te3"]
+
     def test_get_pending_events(self):
         """Test getting pending events."""
         timeline = Timeline(entity_id="P001", entity_type="patient")
@@ -484,6 +503,37 @@ class TestTimeline:
         
         assert len(events) == 2
 
+    def test_get_events_up_to_boundary(self):
+        """Test events on the target date are due and executed ones are not."""
+        timeline = Timeline(entity_id="P001", entity_type="patient")
+        
+        for event_id, month, status in [("te1", 1, "executed"), ("te2", 2, "pending"),
+                                         ("te3", 2, "pending"), ("te4", 3, "pending")]:
+            timeline.add_event(TimelineEvent(
+                timeline_event_id=event_id, journey_id="j1", event_definition_id=event_id,
+                scheduled_date=date(2024, month, 1), event_type="a", event_name="A",
+                status=status
+            ))
+        
+        events = timeline.get_events_up_to(date(2024, 2, 1))
+        
+        assert [e.timeline_event_id for e in events] == ["te2", "te3"]
+
+    def test_get_events_up_to_unsorted_constructor_events(self):
+        """Test events passed to the constructor out of order are all found."""
+        events = [
+            TimelineEvent(
+                timeline_event_id=event_id, journey_id="j1", event_definition_id=event_id,
+                scheduled_date=date(2024, month, 1), event_type="a", event_name="A"
+            )
+            for event_id, month in [("te1", 1), ("te3", 6), ("te2", 2)]
+        ]
+        timeline = Timeline(entity_id="P001", entity_type="patient", events=events)
+        
+        due = timeline.get_events_up_to(date(2024, 3, 1))
+        
+        assert [e.timeline_event_id for e in due] == ["te1", "te2"]
+
     def test_mark_executed(self):
         """Test marking event as executed."""
         timeline = Timeline(entity_id="P001", entity_type="patient")
@@ -555,6 +605,24 @@ class TestJourneyEngine:
         assert "patientsim" in engine._handlers
         assert "encounter" in engine._handlers["patientsim"]
 
+    def test_fork(self, engine, simple_journey):
+        """Test a fork keeps handlers but starts from fresh state."""
+        def my_handler(entity, event, context):
+            return {"handled": True}
+        
+        engine.register_handler("patientsim", "encounter", my_handler)
+        engine.create_timeline({"patient_id": "P001"}, "patient", simple_journey)
+        engine._rng.random()
+        
+        fork = engine.fork()
+        fork.register_handler("patientsim", "lab_order", my_handler)
+        
+        assert fork.seed == 42
+        assert fork._handlers["patientsim"]["encounter"] is my_handler
+        assert "lab_order" not in engine._handlers["patientsim"]
+        assert fork._active_timelines == {}
+        assert fork._rng.random() == JourneyEngine(seed=42)._rng.random()
+
     def test_create_timeline(self, engine, simple_journey):
         """Test creating timeline from journey."""
         entity = {"patient_id": "P001", "name": "Test Patient"}
@@ -630,6 +698,28 @@ class TestJourneyEngine:
         
         assert len(timeline.events) == 0
 
+    def test_conditional_event_generated_entity(self, engine):
+        """Test conditions read attributes of a slotted GeneratedEntity."""
+        journey = JourneySpecification(
+            journey_id="conditional-journey",
+            name="Conditional Journey",
+            events=[
+                EventDefinition(
+                    event_id="e1",
+                    name="Senior Event",
+                    event_type="encounter",
+                    conditions=[
+                        EventCondition(field="entity.age", operator="gte", value=65)
+                    ]
+                )
+            ]
+        )
+        
+        entity = GeneratedEntity(index=0, seed=1, age=70)
+        timeline = engine.create_timeline(entity, "patient", journey)
+        
+        assert len(timeline.events) == 1
+
     def test_probabilistic_event(self, engine):
         """Test probabilistic event inclusion."""
         journey = JourneySpecification(
@@ -714,6 +804,33 @@ class TestJourneyEngine:
         assert len(results) == 2
         assert all(r["status"] == "executed" for r in results)
 
+    def test_execute_timelines_interleaves_by_date(self, engine, simple_journey):
+        """Test executing several timelines runs events in date order."""
+        executed = []
+        
+        def handler(entity, event, context):
+            executed.append((entity["patient_id"], event.event_type))
+            return {"done": True}
+        
+        engine.register_handler("core", "encounter", handler)
+        engine.register_handler("core", "lab_order", handler)
+        
+        first = {"patient_id": "P001"}
+        second = {"patient_id": "P002"}
+        pairs = [
+            (engine.create_timeline(first, "patient", simple_journey, date(2024, 1, 1)), first),
+            (engine.create_timeline(second, "patient", simple_journey, date(2024, 1, 3)), second),
+        ]
+        
+        results = engine.execute_timelines(pairs, up_to_date=date(2024, 1, 10))
+        
+        assert executed == [
+            ("P001", "encounter"), ("P002", "encounter"),
+            ("P001", "lab_order"), ("P002", "lab_order"),
+        ]
+        assert [len(r) for r in results] == [2, 2]
+        assert results[1][0]["scheduled_date"] == "2024-01-03"
+
     def test_timeline_end_date(self, engine, simple_journey):
         """Test timeline end date is set correctly."""
         entity = {"patient_id": "P001"}
@@ -810,6 +927,13 @@ class TestJourneyTemplates:
         assert journey.journey_id == "diabetic-first-year"
         assert len(journey.events) > 0
 
+    def test_get_journey_template_independent(self):
+        """Test edits to a returned template don't leak into later lookups."""
+        journey = get_journey_template("diabetic-first-year")
+        journey.events.clear()
+        
+        assert len(get_journey_template("diabetic-first-year").events) > 0
+
     def test_get_unknown_template_raises(self):
         """Test error for unknown template."""
         with pytest.raises(ValueError, match="not found"):
@@ -4,6 +4,7 @@ import pytest
 import random
 from datetime import date
 
+from healthsim.generation import profile_executor
 from healthsim.generation.profile_executor import (
     HierarchicalSeedManager,
     GeneratedEntity,
@@ -11,6 +12,7 @@ from healthsim.generation.profile_executor import (
     ValidationMetric,
     ValidationReport,
     ProfileExecutor,
+    PARALLEL_MIN_COUNT,
     execute_profile,
 )
 from healthsim.generation.profile_schema import (
@@ -70,6 +72,15 @@ class TestHierarchicalSeedManager:
         
         assert len(set(seeds)) == 100  # All unique
 
+    def test_entity_seeds_match_randint_sequence(self):
+        """Test entity seeds follow the master RNG's randint sequence."""
+        manager = HierarchicalSeedManager(master_seed=42)
+        master = random.Random(42)
+        
+        expected = [master.randint(0, 2**31 - 1) for _ in range(50)]
+        
+        assert [manager.get_entity_seed(i) for i in range(50)] == expected
+
     def test_get_entity_rng(self):
         """Test getting RNG for entity."""
         manager = HierarchicalSeedManager(master_seed=42)
@@ -475,6 +486,38 @@ class TestProfileExecutor:
         
         assert ages1 != ages2
 
+    def test_execute_parallel_matches_execute(self, full_profile):
+        """Test parallel execution generates the same entities as execute()."""
+        executor = ProfileExecutor(full_profile, seed=42)
+        
+        serial = executor.execute(count_override=PARALLEL_MIN_COUNT)
+        parallel = executor.execute_parallel(max_workers=2, count_override=PARALLEL_MIN_COUNT)
+        
+        assert parallel.count == PARALLEL_MIN_COUNT
+        assert parallel.entities == serial.entities
+
+    def test_execute_parallel_small_batch_in_process(self, demographics_profile):
+        """Test batches below the threshold are generated without a worker pool."""
+        executor = ProfileExecutor(demographics_profile, seed=42)
+        
+        result = executor.execute_parallel(max_workers=4)
+        
+        assert result.entities == executor.execute().entities
+
+    def test_distributions_built_once_per_spec(self, demographics_profile, monkeypatch):
+        """Test each distribution spec is turned into a distribution only once."""
+        built = []
+        create_distribution = profile_executor.create_distribution
+        monkeypatch.setattr(
+            profile_executor,
+            "create_distribution",
+            lambda spec: built.append(spec["type"]) or create_distribution(spec),
+        )
+        
+        ProfileExecutor(demographics_profile, seed=42).execute()
+        
+        assert sorted(built) == ["categorical", "normal"]
+
     def test_count_override(self, minimal_profile):
         """Test count override."""
         executor = ProfileExecutor(minimal_profile)
@@ -2,9 +2,12 @@
 
 import pytest
 import json
-from pathlib import Path
-from unittest.mock import patch
-import tempfile
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from healthsim.mcp.profile_server import (
     # Profile formatters
@@ -45,582 +48,624 @@ from healthsim.generation.profile_schema import (
 from healthsim.generation.profile_executor import ExecutionResult, ValidationReport
 
 
+def _dumps_bytes(obj):
+    """Encode a test payload to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _dumps(obj):
+    """Encode a test payload to a JSON string."""
+    return _dumps_bytes(obj).decode()
+
+
+def _any_of(*needles):
+    """Compile one pattern matching any of the given literal substrings."""
+    return re.compile("|".join(map(re.escape, needles)))
+
+
+# Expected listing entries, each checked with a single findall pass
+_PROFILE_LIST_ENTRIES = ("Profile 1", "profile-1", "First profile", "Profile 2")
+_PROFILE_LIST_PATTERN = _any_of(*_PROFILE_LIST_ENTRIES)
+_TEMPLATE_LIST_ENTRIES = ("Profile Templates", "medicare-standard", "commercial-family")
+_TEMPLATE_LIST_PATTERN = _any_of(*_TEMPLATE_LIST_ENTRIES)
+_JOURNEY_LIST_ENTRIES = ("Journey 0", "Journey 1", "Journey 2")
+_JOURNEY_LIST_PATTERN = _any_of(*_JOURNEY_LIST_ENTRIES)
+
+
+# Shared handler arguments; the handlers only read from them
+_NO_ARGS = {}
+_MISSING_NAME_ARGS = {"name": "nonexistent"}
+_MISSING_TEMPLATE_ARGS = {"template_name": "nonexistent-template"}
+
+
+# Journey payloads serialized once at import and shared by the handler tests
+_JOURNEY_JSON = {
+    "save": _dumps({
+        "journey_id": "test-save-journey",
+        "name": "Test Save Journey",
+        "events": [],
+    }),
+    "duplicate": _dumps({
+        "journey_id": "duplicate-journey",
+        "name": "Original",
+        "events": [],
+    }),
+    "duplicate_updated": _dumps({
+        "journey_id": "duplicate-journey",
+        "name": "Updated",
+        "events": [],
+    }),
+    "overwrite": _dumps({
+        "journey_id": "overwrite-journey",
+        "name": "Original",
+        "events": [],
+    }),
+    "overwrite_updated": _dumps({
+        "journey_id": "overwrite-journey",
+        "name": "Updated",
+        "events": [],
+    }),
+    "loadable": _dumps({
+        "journey_id": "loadable-journey",
+        "name": "Loadable Journey",
+        "description": "Can be loaded",
+        "events": [{"name": "Event 1", "event_type": "encounter"}],
+    }),
+    "execute": _dumps({
+        "journey_id": "exec-test",
+        "name": "Execution Test",
+        "duration_days": 7,
+        "events": [
+            {
+                "event_id": "evt-1",
+                "name": "Initial Event",
+                "event_type": "encounter",
+                "day_offset": 0,
+            }
+        ],
+    }),
+    "date_test": _dumps({"journey_id": "date-test", "name": "Date Test", "events": []}),
+}
+
+
+@pytest.fixture(scope="class")
+def _journeys_storage(tmp_path_factory):
+    """Journey storage directory patched into the server for a test class."""
+    path = tmp_path_factory.mktemp("journeys")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("healthsim.mcp.profile_server.JOURNEYS_DIR", path)
+        yield path
+
+
+@pytest.fixture
+def journeys_dir(_journeys_storage):
+    """Shared journey storage, emptied after each test."""
+    yield _journeys_storage
+    for f in _journeys_storage.iterdir():
+        f.unlink()
+
+
 # =============================================================================
 # Profile Formatter Tests
 # =============================================================================
 
-class TestFormatProfileSummary:
-    """Tests for format_profile_summary."""
-
-    def test_basic_profile(self):
-        """Test formatting a basic profile."""
-        profile = ProfileSpecification(
-            id="test-profile-001",
-            name="Test Profile",
-            version="1.0",
-            generation=GenerationSpec(count=50, products=["patientsim"]),
-        )
-        result = format_profile_summary(profile)
-        
-        assert "Test Profile" in result
-        assert "test-profile-001" in result
-        assert "50" in result
-        assert "patientsim" in result
-
-    def test_profile_with_demographics(self):
-        """Test formatting profile with demographics."""
-        profile = ProfileSpecification(
-            id="test-demo-001",
-            name="Demo Profile",
-            generation=GenerationSpec(count=100),
-            demographics=DemographicsSpec(
-                age=DistributionSpec(
-                    type=DistributionType.NORMAL,
-                    mean=72.0,
-                    std_dev=8.0,
-                )
-            ),
-        )
-        result = format_profile_summary(profile)
-        
-        assert "Demographics" in result
-        assert "72" in result
-
-    def test_profile_with_clinical(self):
-        """Test formatting profile with clinical specs."""
-        profile = ProfileSpecification(
-            id="test-clinical-001",
-            name="Clinical Profile",
-            clinical=ClinicalSpec(
-                primary_condition=ConditionSpec(
-                    code="E11",
-                    description="Type 2 Diabetes",
-                )
-            ),
-        )
-        result = format_profile_summary(profile)
-        
-        assert "Clinical" in result
-        assert "E11" in result
-        assert "Diabetes" in result
-
-
-class TestFormatProfileList:
-    """Tests for format_profile_list."""
-
-    def test_empty_list(self):
-        """Test formatting empty profile list."""
-        result = format_profile_list([])
-        assert "No saved profiles" in result
-
-    def test_profile_list(self):
-        """Test formatting profile list."""
-        profiles = [
-            {"name": "Profile 1", "id": "profile-1", "description": "First profile"},
-            {"name": "Profile 2", "id": "profile-2"},
-        ]
-        result = format_profile_list(profiles)
-        
-        assert "Profile 1" in result
-        assert "profile-1" in result
-        assert "First profile" in result
-        assert "Profile 2" in result
-
-
-class TestFormatTemplateList:
-    """Tests for format_template_list."""
-
-    def test_template_list(self):
-        """Test formatting template list."""
-        templates = {
-            "medicare-standard": {"description": "Medicare population"},
-            "commercial-family": {"name": "Family Coverage"},
-        }
-        result = format_template_list(templates, "profile")
-        
-        assert "Profile Templates" in result
-        assert "medicare-standard" in result
-        assert "commercial-family" in result
-
-
-class TestFormatExecutionResult:
-    """Tests for format_execution_result."""
-
-    def test_basic_result(self):
-        """Test formatting execution result."""
-        result = ExecutionResult(
-            profile_id="test-profile-001",
-            count=100,
-            seed=12345,
-            entities=[],  # Empty for this test
-            duration_seconds=1.5,
-            validation=ValidationReport(),  # Empty report = passed
-        )
-        formatted = format_execution_result(result)
-        
-        assert "100" in formatted
-        assert "12345" in formatted
-        assert "1.5" in formatted
-        assert "Passed" in formatted
-
-    def test_result_with_warnings(self):
-        """Test formatting result with warnings."""
-        result = ExecutionResult(
-            profile_id="test-profile-002",
-            count=50,
-            seed=42,
-            entities=[],
-            duration_seconds=0.8,
-            validation=ValidationReport(
-                warnings=["Age distribution slightly skewed"],
-            ),
-        )
-        formatted = format_execution_result(result)
-        
-        assert "Warnings: 1" in formatted
+@pytest.fixture(scope="module")
+def basic_profile():
+    """Basic profile specification shared by the formatter tests."""
+    return ProfileSpecification(
+        id="test-profile-001",
+        name="Test Profile",
+        version="1.0",
+        generation=GenerationSpec(count=50, products=["patientsim"]),
+    )
+
+
+@pytest.fixture(scope="module")
+def demographics_profile():
+    """Profile specification with an age distribution."""
+    return ProfileSpecification(
+        id="test-demo-001",
+        name="Demo Profile",
+        generation=GenerationSpec(count=100),
+        demographics=DemographicsSpec(
+            age=DistributionSpec(
+                type=DistributionType.NORMAL,
+                mean=72.0,
+                std_dev=8.0,
+            )
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def clinical_profile():
+    """Profile specification with a primary condition."""
+    return ProfileSpecification(
+        id="test-clinical-001",
+        name="Clinical Profile",
+        clinical=ClinicalSpec(
+            primary_condition=ConditionSpec(
+                code="E11",
+                description="Type 2 Diabetes",
+            )
+        ),
+    )
+
+
+def test_format_profile_summary_basic(basic_profile):
+    """Test formatting a basic profile."""
+    result = format_profile_summary(basic_profile)
+    
+    assert "Test Profile" in result
+    assert "test-profile-001" in result
+    assert "50" in result
+    assert "patientsim" in result
+
+
+def test_format_profile_summary_with_demographics(demographics_profile):
+    """Test formatting profile with demographics."""
+    result = format_profile_summary(demographics_profile)
+    
+    assert "Demographics" in result
+    assert "72" in result
+
+
+def test_format_profile_summary_with_clinical(clinical_profile):
+    """Test formatting profile with clinical specs."""
+    result = format_profile_summary(clinical_profile)
+    
+    assert "Clinical" in result
+    assert "E11" in result
+    assert "Diabetes" in result
+
+
+def test_format_profile_list_empty():
+    """Test formatting empty profile list."""
+    result = format_profile_list([])
+    assert "No saved profiles" in result
+
+
+def test_format_profile_list():
+    """Test formatting profile list."""
+    profiles = [
+        {"name": "Profile 1", "id": "profile-1", "description": "First profile"},
+        {"name": "Profile 2", "id": "profile-2"},
+    ]
+    result = format_profile_list(profiles)
+    
+    assert set(_PROFILE_LIST_PATTERN.findall(result)) == set(_PROFILE_LIST_ENTRIES)
+
+
+def test_format_template_list():
+    """Test formatting template list."""
+    templates = {
+        "medicare-standard": {"description": "Medicare population"},
+        "commercial-family": {"name": "Family Coverage"},
+    }
+    result = format_template_list(templates, "profile")
+    
+    assert set(_TEMPLATE_LIST_PATTERN.findall(result)) == set(_TEMPLATE_LIST_ENTRIES)
+
+
+@pytest.fixture(scope="module")
+def passed_execution():
+    """Execution result with an empty (passing) validation report."""
+    return ExecutionResult(
+        profile_id="test-profile-001",
+        count=100,
+        seed=12345,
+        entities=[],  # Empty for this test
+        duration_seconds=1.5,
+        validation=ValidationReport(),  # Empty report = passed
+    )
+
+
+@pytest.fixture(scope="module")
+def execution_with_warnings():
+    """Execution result whose validation report carries a warning."""
+    return ExecutionResult(
+        profile_id="test-profile-002",
+        count=50,
+        seed=42,
+        entities=[],
+        duration_seconds=0.8,
+        validation=ValidationReport(
+            warnings=["Age distribution slightly skewed"],
+        ),
+    )
+
+
+def test_format_execution_result_basic(passed_execution):
+    """Test formatting execution result."""
+    formatted = format_execution_result(passed_execution)
+    
+    assert "100" in formatted
+    assert "12345" in formatted
+    assert "1.5" in formatted
+    assert "Passed" in formatted
+
+
+def test_format_execution_result_with_warnings(execution_with_warnings):
+    """Test formatting result with warnings."""
+    formatted = format_execution_result(execution_with_warnings)
+    
+    assert "Warnings: 1" in formatted
 
 
 # =============================================================================
 # Journey Formatter Tests
 # =============================================================================
 
-class TestFormatJourneySummary:
-    """Tests for format_journey_summary."""
-
-    def test_basic_journey(self):
-        """Test formatting a basic journey."""
-        journey = {
-            "journey_id": "test-journey-001",
-            "name": "Test Journey",
-            "description": "A test journey",
-            "duration_days": 30,
-            "products": ["patientsim"],
-            "events": [
-                {"name": "Event 1", "event_type": "encounter"},
-                {"name": "Event 2", "event_type": "lab_order"},
-            ]
-        }
-        result = format_journey_summary(journey)
-        
-        assert "Test Journey" in result
-        assert "test-journey-001" in result
-        assert "30" in result
-        assert "2" in result  # event count
-        assert "patientsim" in result
-
-    def test_journey_with_many_events(self):
-        """Test formatting journey with more than 8 events."""
-        events = [{"name": f"Event {i}", "event_type": "encounter"} for i in range(15)]
-        journey = {
-            "journey_id": "many-events",
-            "name": "Many Events Journey",
-            "events": events
-        }
-        result = format_journey_summary(journey)
-        
-        assert "15" in result  # total count
-        assert "and 7 more" in result  # 15 - 8 = 7
-
-
-class TestFormatJourneyList:
-    """Tests for format_journey_list."""
 
-    def test_empty_list(self):
-        """Test formatting empty journey list."""
-        result = format_journey_list([])
-        assert "No saved journeys" in result
-
-    def test_journey_list(self):
-        """Test formatting journey list."""
-        journeys = [
-            {
-                "journey_id": "journey-1",
-                "name": "Journey 1",
-                "description": "First journey",
-                "duration_days": 30,
-                "events": [{"name": "e1"}, {"name": "e2"}]
-            },
-            {
-                "journey_id": "journey-2",
-                "name": "Journey 2",
-                "events": [{"name": "e1"}]
-            },
+def test_format_journey_summary_basic():
+    """Test formatting a basic journey."""
+    journey = {
+        "journey_id": "test-journey-001",
+        "name": "Test Journey",
+        "description": "A test journey",
+        "duration_days": 30,
+        "products": ["patientsim"],
+        "events": [
+            {"name": "Event 1", "event_type": "encounter"},
+            {"name": "Event 2", "event_type": "lab_order"},
         ]
-        result = format_journey_list(journeys)
-        
-        assert "Journey 1" in result
-        assert "journey-1" in result
-        assert "First journey" in result
-        assert "Journey 2" in result
-        assert "2 events" in result
-        assert "30 days" in result
+    }
+    result = format_journey_summary(journey)
+    
+    assert "Test Journey" in result
+    assert "test-journey-001" in result
+    assert "30" in result
+    assert "2" in result  # event count
+    assert "patientsim" in result
+
+
+def test_format_journey_summary_with_many_events():
+    """Test formatting journey with more than 8 events."""
+    events = [{"name": f"Event {i}", "event_type": "encounter"} for i in range(15)]
+    journey = {
+        "journey_id": "many-events",
+        "name": "Many Events Journey",
+        "events": events
+    }
+    result = format_journey_summary(journey)
+    
+    assert "15" in result  # total count
+    assert "and 7 more" in result  # 15 - 8 = 7
+
+
+def test_format_journey_list_empty():
+    """Test formatting empty journey list."""
+    result = format_journey_list([])
+    assert "No saved journeys" in result
+
+
+def test_format_journey_list():
+    """Test formatting journey list."""
+    journeys = [
+        {
+            "journey_id": "journey-1",
+            "name": "Journey 1",
+            "description": "First journey",
+            "duration_days": 30,
+            "events": [{"name": "e1"}, {"name": "e2"}]
+        },
+        {
+            "journey_id": "journey-2",
+            "name": "Journey 2",
+            "events": [{"name": "e1"}]
+        },
+    ]
+    result = format_journey_list(journeys)
+    
+    assert "Journey 1" in result
+    assert "journey-1" in result
+    assert "First journey" in result
+    assert "Journey 2" in result
+    assert "2 events" in result
+    assert "30 days" in result
 
 
 # =============================================================================
 # Utility Formatter Tests
 # =============================================================================
 
-class TestUtilityFormatters:
-    """Tests for utility formatting functions."""
 
-    def test_format_error(self):
-        """Test error message formatting."""
-        result = format_error("Something went wrong")
-        assert "Error" in result
-        assert "Something went wrong" in result
+def test_format_error():
+    """Test error message formatting."""
+    result = format_error("Something went wrong")
+    assert "Error" in result
+    assert "Something went wrong" in result
+
 
-    def test_format_success(self):
-        """Test success message formatting."""
-        result = format_success("Operation completed")
-        assert "✓" in result
-        assert "Operation completed" in result
+def test_format_success():
+    """Test success message formatting."""
+    result = format_success("Operation completed")
+    assert "✓" in result
+    assert "Operation completed" in result
 
 
 # =============================================================================
 # Profile Handler Tests
 # =============================================================================
 
-@pytest.mark.asyncio
 class TestBuildProfileHandler:
     """Tests for build_profile handler."""
 
-    async def test_build_basic_profile(self):
-        """Test building a basic profile."""
-        result = await handle_build_profile({"name": "Test Profile"})
+    @pytest.mark.parametrize(
+        "arguments, expected",
+        [
+            ({"name": "Test Profile"}, ["Test Profile", "test-profile"]),
+            ({"name": "My Profile", "id": "custom-id-001"}, ["custom-id-001"]),
+            (
+                {
+                    "name": "Demo Profile",
+                    "age_mean": 65,
+                    "age_std": 10,
+                    "age_min": 50,
+                    "age_max": 85,
+                },
+                ["Demographics"],
+            ),
+            (
+                {
+                    "name": "Clinical Profile",
+                    "primary_condition_code": "E11",
+                    "primary_condition_name": "Type 2 Diabetes",
+                },
+                ["E11"],
+            ),
+        ],
+        ids=["basic", "custom-id", "demographics", "clinical"],
+    )
+    async def test_build_profile(self, arguments, expected):
+        """Test building profiles from tool arguments."""
+        result = await handle_build_profile(arguments)
         
         assert len(result) == 1
         text = result[0].text
-        assert "Test Profile" in text
-        assert "test-profile" in text
-
-    async def test_build_profile_with_id(self):
-        """Test building profile with custom ID."""
-        result = await handle_build_profile({
-            "name": "My Profile",
-            "id": "custom-id-001",
-        })
-        
-        text = result[0].text
-        assert "custom-id-001" in text
-
-    async def test_build_profile_with_demographics(self):
-        """Test building profile with demographics."""
-        result = await handle_build_profile({
-            "name": "Demo Profile",
-            "age_mean": 65,
-            "age_std": 10,
-            "age_min": 50,
-            "age_max": 85,
-        })
-        
-        text = result[0].text
-        assert "Demographics" in text
-
-    async def test_build_profile_with_clinical(self):
-        """Test building profile with clinical specs."""
-        result = await handle_build_profile({
-            "name": "Clinical Profile",
-            "primary_condition_code": "E11",
-            "primary_condition_name": "Type 2 Diabetes",
-        })
-        
-        text = result[0].text
-        assert "E11" in text
+        for fragment in expected:
+            assert fragment in text
+
+
+@pytest.fixture(scope="module")
+def save_profile_json():
+    """Serialized profile for the save handler test."""
+    return ProfileSpecification(
+        id="test-save-001",
+        name="Test Save Profile",
+        generation=GenerationSpec(count=10),
+    ).to_json()
+
+
+@pytest.fixture(scope="module")
+def resave_profile_json():
+    """Serialized minimal profile for the unchanged re-save test."""
+    return ProfileSpecification(
+        id="test-resave-001",
+        name="Test Resave Profile",
+    ).to_json()
 
 
-@pytest.mark.asyncio
 class TestSaveLoadProfileHandlers:
     """Tests for save/load profile handlers."""
 
-    async def test_save_and_list_profiles(self):
+    @pytest.mark.slow
+    async def test_save_and_list_profiles(self, tmp_path, monkeypatch, save_profile_json):
         """Test saving and listing profiles."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            profiles_dir = Path(tmpdir)
-            
-            # Patch the storage directory
-            with patch("healthsim.mcp.profile_server.PROFILES_DIR", profiles_dir):
-                # Create a profile
-                profile = ProfileSpecification(
-                    id="test-save-001",
-                    name="Test Save Profile",
-                    generation=GenerationSpec(count=10),
-                )
-                
-                # Save it
-                result = await handle_save_profile({
-                    "profile_json": profile.to_json(),
-                })
-                
-                assert "✓" in result[0].text or "Saved" in result[0].text
-
-    async def test_load_profile_not_found(self):
+        # Patch the storage directory
+        monkeypatch.setattr("healthsim.mcp.profile_server.PROFILES_DIR", tmp_path)
+        
+        # Save a profile
+        result = await handle_save_profile({
+            "profile_json": save_profile_json,
+        })
+        
+        assert "✓" in result[0].text or "Saved" in result[0].text
+
+    async def test_resave_unchanged_profile_skips_write(
+        self, tmp_path, monkeypatch, resave_profile_json
+    ):
+        """Test re-saving an identical profile leaves the file untouched."""
+        monkeypatch.setattr("healthsim.mcp.profile_server.PROFILES_DIR", tmp_path)
+        
+        args = {"profile_json": resave_profile_json, "overwrite": True}
+        
+        await handle_save_profile(args)
+        filepath = tmp_path / "test-resave-001.json"
+        mtime = filepath.stat().st_mtime_ns
+        
+        result = await handle_save_profile(args)
+        
+        assert "Saved" in result[0].text
+        assert filepath.stat().st_mtime_ns == mtime
+
+    async def test_load_profile_not_found(self, tmp_path, monkeypatch):
         """Test loading non-existent profile."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            profiles_dir = Path(tmpdir)
-            
-            with patch("healthsim.mcp.profile_server.PROFILES_DIR", profiles_dir):
-                result = await handle_load_profile({"name": "nonexistent"})
-                
-                text = result[0].text
-                assert "not found" in text.lower() or "error" in text.lower()
+        monkeypatch.setattr("healthsim.mcp.profile_server.PROFILES_DIR", tmp_path)
+        
+        result = await handle_load_profile(_MISSING_NAME_ARGS)
+        
+        text = result[0].text
+        assert "not found" in text.lower() or "error" in text.lower()
 
 
-@pytest.mark.asyncio
 class TestProfileTemplateHandlers:
     """Tests for profile template handlers."""
 
     async def test_list_profile_templates(self):
         """Test listing profile templates."""
-        result = await handle_list_profile_templates({})
+        result = await handle_list_profile_templates(_NO_ARGS)
         
         text = result[0].text
         assert "Template" in text
 
-    async def test_get_profile_template_not_found(self):
-        """Test getting non-existent profile template."""
-        result = await handle_get_profile_template({
-            "template_name": "nonexistent-template"
-        })
-        
-        text = result[0].text
-        assert "not found" in text.lower() or "error" in text.lower()
-
 
 # =============================================================================
 # Journey Handler Tests
 # =============================================================================
 
-@pytest.mark.asyncio
 class TestBuildJourneyHandler:
     """Tests for build_journey handler."""
 
-    async def test_build_basic_journey(self):
-        """Test building a basic journey."""
-        result = await handle_build_journey({"name": "Test Journey"})
+    @pytest.mark.parametrize(
+        "arguments, expected",
+        [
+            ({"name": "Test Journey"}, ["Test Journey", "test-journey"]),
+            (
+                {
+                    "name": "Journey With Events",
+                    "duration_days": 30,
+                    "events": [
+                        {"name": "Initial Visit", "event_type": "encounter"},
+                        {"name": "Follow Up", "event_type": "encounter"},
+                    ],
+                },
+                ["Journey With Events", "Events (2)"],
+            ),
+            (
+                {"name": "Custom ID Journey", "id": "my-custom-journey-id"},
+                ["my-custom-journey-id"],
+            ),
+        ],
+        ids=["basic", "with-events", "custom-id"],
+    )
+    async def test_build_journey(self, arguments, expected):
+        """Test building journeys from tool arguments."""
+        result = await handle_build_journey(arguments)
         
         assert len(result) == 1
         text = result[0].text
-        assert "Test Journey" in text
-        assert "test-journey" in text
+        for fragment in expected:
+            assert fragment in text
 
-    async def test_build_journey_with_events(self):
-        """Test building journey with events."""
-        result = await handle_build_journey({
-            "name": "Journey With Events",
-            "duration_days": 30,
-            "events": [
-                {"name": "Initial Visit", "event_type": "encounter"},
-                {"name": "Follow Up", "event_type": "encounter"},
-            ]
-        })
-        
-        text = result[0].text
-        assert "Journey With Events" in text
-        assert "2" in text  # event count
-
-    async def test_build_journey_with_custom_id(self):
-        """Test building journey with custom ID."""
-        result = await handle_build_journey({
-            "name": "Custom ID Journey",
-            "id": "my-custom-journey-id",
-        })
-        
-        text = result[0].text
-        assert "my-custom-journey-id" in text
 
-
-@pytest.mark.asyncio
 class TestSaveLoadJourneyHandlers:
     """Tests for save/load journey handlers."""
 
-    async def test_save_journey(self):
+    async def test_save_journey(self, journeys_dir):
         """Test saving a journey."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            journeys_dir = Path(tmpdir)
-            
-            with patch("healthsim.mcp.profile_server.JOURNEYS_DIR", journeys_dir):
-                journey = {
-                    "journey_id": "test-save-journey",
-                    "name": "Test Save Journey",
-                    "events": []
-                }
-                
-                result = await handle_save_journey({
-                    "journey_json": json.dumps(journey),
-                })
-                
-                assert "✓" in result[0].text or "Saved" in result[0].text
-                
-                # Verify file was created
-                filepath = journeys_dir / "test-save-journey.json"
-                assert filepath.exists()
-
-    async def test_save_journey_no_overwrite(self):
+        result = await handle_save_journey({
+            "journey_json": _JOURNEY_JSON["save"],
+        })
+        
+        assert "✓" in result[0].text or "Saved" in result[0].text
+        
+        # Verify file was created
+        filepath = journeys_dir / "test-save-journey.json"
+        assert filepath.exists()
+
+    async def test_save_journey_no_overwrite(self, journeys_dir):
         """Test that save_journey doesn't overwrite by default."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            journeys_dir = Path(tmpdir)
-            
-            with patch("healthsim.mcp.profile_server.JOURNEYS_DIR", journeys_dir):
-                journey = {
-                    "journey_id": "duplicate-journey",
-                    "name": "Original",
-                    "events": []
-                }
-                
-                # Save first time
-                await handle_save_journey({"journey_json": json.dumps(journey)})
-                
-                # Try to save again
-                journey["name"] = "Updated"
-                result = await handle_save_journey({
-                    "journey_json": json.dumps(journey),
-                })
-                
-                text = result[0].text
-                assert "exists" in text.lower() or "error" in text.lower()
-
-    async def test_save_journey_with_overwrite(self):
+        # Save first time
+        await handle_save_journey({"journey_json": _JOURNEY_JSON["duplicate"]})
+        
+        # Try to save again
+        result = await handle_save_journey({
+            "journey_json": _JOURNEY_JSON["duplicate_updated"],
+        })
+        
+        text = result[0].text
+        assert "exists" in text.lower() or "error" in text.lower()
+
+    async def test_save_journey_with_overwrite(self, journeys_dir):
         """Test save_journey with overwrite=True."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            journeys_dir = Path(tmpdir)
-            
-            with patch("healthsim.mcp.profile_server.JOURNEYS_DIR", journeys_dir):
-                journey = {
-                    "journey_id": "overwrite-journey",
-                    "name": "Original",
-                    "events": []
-                }
-                
-                # Save first time
-                await handle_save_journey({"journey_json": json.dumps(journey)})
-                
-                # Save again with overwrite
-                journey["name"] = "Updated"
-                result = await handle_save_journey({
-                    "journey_json": json.dumps(journey),
-                    "overwrite": True,
-                })
-                
-                assert "✓" in result[0].text or "Saved" in result[0].text
-
-    async def test_load_journey_not_found(self):
+        # Save first time
+        await handle_save_journey({"journey_json": _JOURNEY_JSON["overwrite"]})
+        
+        # Save again with overwrite
+        result = await handle_save_journey({
+            "journey_json": _JOURNEY_JSON["overwrite_updated"],
+            "overwrite": True,
+        })
+        
+        assert "✓" in result[0].text or "Saved" in result[0].text
+
+    async def test_load_journey_not_found(self, journeys_dir):
         """Test loading non-existent journey."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            journeys_dir = Path(tmpdir)
-            
-            with patch("healthsim.mcp.profile_server.JOURNEYS_DIR", journeys_dir):
-                result = await handle_load_journey({"name": "nonexistent"})
-                
-                text = result[0].text
-                assert "not found" in text.lower() or "error" in text.lower()
-
-    async def test_load_saved_journey(self):
+        result = await handle_load_journey(_MISSING_NAME_ARGS)
+        
+        text = result[0].text
+        assert "not found" in text.lower() or "error" in text.lower()
+
+    @pytest.mark.slow
+    async def test_load_saved_journey(self, journeys_dir):
         """Test loading a saved journey."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            journeys_dir = Path(tmpdir)
-            
-            with patch("healthsim.mcp.profile_server.JOURNEYS_DIR", journeys_dir):
-                journey = {
-                    "journey_id": "loadable-journey",
-                    "name": "Loadable Journey",
-                    "description": "Can be loaded",
-                    "events": [{"name": "Event 1", "event_type": "encounter"}]
-                }
-                
-                # Save it
-                filepath = journeys_dir / "loadable-journey.json"
-                filepath.write_text(json.dumps(journey))
-                
-                # Load it
-                result = await handle_load_journey({"name": "loadable-journey"})
-                
-                text = result[0].text
-                assert "Loadable Journey" in text
-                assert "Event 1" in text
-
-
-@pytest.mark.asyncio
+        # Save it
+        filepath = journeys_dir / "loadable-journey.json"
+        filepath.write_text(_JOURNEY_JSON["loadable"])
+        
+        # Load it
+        result = await handle_load_journey({"name": "loadable-journey"})
+        
+        text = result[0].text
+        assert "Loadable Journey" in text
+        assert "Event 1" in text
+
+
 class TestListJourneysHandler:
     """Tests for list_journeys handler."""
 
-    async def test_list_empty_journeys(self):
+    async def test_list_empty_journeys(self, journeys_dir):
         """Test listing when no journeys exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            journeys_dir = Path(tmpdir)
-            
-            with patch("healthsim.mcp.profile_server.JOURNEYS_DIR", journeys_dir):
-                result = await handle_list_journeys({})
-                
-                text = result[0].text
-                assert "No saved journeys" in text
-
-    async def test_list_journeys(self):
+        result = await handle_list_journeys(_NO_ARGS)
+        
+        text = result[0].text
+        assert "No saved journeys" in text
+
+    async def test_list_journeys(self, journeys_dir):
         """Test listing saved journeys."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            journeys_dir = Path(tmpdir)
-            
-            with patch("healthsim.mcp.profile_server.JOURNEYS_DIR", journeys_dir):
-                # Create some journeys
-                for i in range(3):
-                    journey = {
-                        "journey_id": f"journey-{i}",
-                        "name": f"Journey {i}",
-                        "events": [{"name": f"e{j}"} for j in range(i + 1)]
-                    }
-                    filepath = journeys_dir / f"journey-{i}.json"
-                    filepath.write_text(json.dumps(journey))
-                
-                result = await handle_list_journeys({})
-                
-                text = result[0].text
-                assert "Journey 0" in text
-                assert "Journey 1" in text
-                assert "Journey 2" in text
-
-
-@pytest.mark.asyncio
+        # Create some journeys
+        payloads = {
+            journeys_dir / f"journey-{i}.json": _dumps_bytes({
+                "journey_id": f"journey-{i}",
+                "name": f"Journey {i}",
+                "events": [{"name": f"e{j}"} for j in range(i + 1)]
+            })
+            for i in range(3)
+        }
+        for filepath, data in payloads.items():
+            filepath.write_bytes(data)
+        
+        result = await handle_list_journeys(_NO_ARGS)
+        
+        text = result[0].text
+        assert set(_JOURNEY_LIST_PATTERN.findall(text)) == set(_JOURNEY_LIST_ENTRIES)
+
+
 class TestJourneyTemplateHandlers:
     """Tests for journey template listing handlers."""
 
     async def test_list_journey_templates(self):
         """Test listing journey templates."""
-        result = await handle_list_journey_templates({})
+        result = await handle_list_journey_templates(_NO_ARGS)
         
         text = result[0].text
         assert "Template" in text or "journey" in text.lower()
 
-    async def test_get_journey_template_not_found(self):
-        """Test getting non-existent journey template."""
-        result = await handle_get_journey_template({
-            "template_name": "nonexistent-template"
-        })
-        
-        text = result[0].text
-        assert "not found" in text.lower() or "error" in text.lower()
+
+@pytest.mark.parametrize(
+    "handler",
+    [handle_get_profile_template, handle_get_journey_template],
+    ids=["profile", "journey"],
+)
+async def test_get_template_not_found(handler):
+    """Test getting a non-existent template."""
+    result = await handler(_MISSING_TEMPLATE_ARGS)
+    
+    text = result[0].text
+    assert "not found" in text.lower() or "error" in text.lower()
 
 
-@pytest.mark.asyncio
 class TestExecuteJourneyHandler:
     """Tests for execute_journey handler."""
 
+    @pytest.mark.slow
     async def test_execute_journey_from_json(self):
         """Test executing journey from JSON."""
-        journey = {
-            "journey_id": "exec-test",
-            "name": "Execution Test",
-            "duration_days": 7,
-            "events": [
-                {
-                    "event_id": "evt-1",
-                    "name": "Initial Event",
-                    "event_type": "encounter",
-                    "day_offset": 0
-                }
-            ]
-        }
-        
         result = await handle_execute_journey({
-            "journey_json": json.dumps(journey),
+            "journey_json": _JOURNEY_JSON["execute"],
             "entity_id": "patient-123",
             "start_date": "2024-01-01",
         })
@@ -631,17 +676,16 @@ class TestExecuteJourneyHandler:
 
     async def test_execute_journey_missing_source(self):
         """Test execute_journey with no journey source."""
-        result = await handle_execute_journey({})
+        result = await handle_execute_journey(_NO_ARGS)
         
         text = result[0].text
         assert "error" in text.lower() or "provide" in text.lower()
 
+    @pytest.mark.slow
     async def test_execute_journey_invalid_date(self):
         """Test execute_journey with invalid date format."""
-        journey = {"journey_id": "date-test", "name": "Date Test", "events": []}
-        
         result = await handle_execute_journey({
-            "journey_json": json.dumps(journey),
+            "journey_json": _JOURNEY_JSON["date_test"],
             "start_date": "not-a-date",
         })
         
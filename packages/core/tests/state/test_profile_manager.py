@@ -4,12 +4,18 @@ Phase 5.1: Profile Persistence
 Phase 5.2: Execution History
 """
 
+import os
+import subprocess
+import sys
+
 import pytest
 from datetime import datetime
 from pathlib import Path
 import tempfile
+import json
 import duckdb
 
+from healthsim.db.schema import apply_schema
 from healthsim.state.profile_manager import (
     ProfileManager,
     ProfileRecord,
@@ -23,36 +29,56 @@ from healthsim.state.profile_manager import (
 # Test Fixtures
 # =============================================================================
 
-@pytest.fixture
-def temp_db():
-    """Create a temporary in-memory database for testing."""
+@pytest.fixture(scope="session")
+def _duckdb_conn():
+    """Shared in-memory database for the test session."""
     conn = duckdb.connect(":memory:")
     yield conn
     conn.close()
 
 
 @pytest.fixture
-def profile_manager(temp_db):
-    """Create a ProfileManager with in-memory database."""
-    return ProfileManager(temp_db)
+def temp_db(_duckdb_conn):
+    """In-memory database whose changes are rolled back after each test."""
+    _duckdb_conn.execute("BEGIN TRANSACTION")
+    try:
+        yield _duckdb_conn
+    finally:
+        _duckdb_conn.execute("ROLLBACK")
+
+
+@pytest.fixture(scope="session")
+def _session_profile_manager(_duckdb_conn):
+    """ProfileManager whose tables are created once, outside any test transaction."""
+    return ProfileManager(_duckdb_conn)
 
 
 @pytest.fixture
-def sample_profile_spec():
-    """Sample profile specification for testing."""
-    return {
-        "profile": {
-            "id": "test-profile",
-            "generation": {"count": 100, "seed": 42},
-            "demographics": {
-                "source": "populationsim",
-                "reference": {"type": "county", "fips": "48201"}
-            },
-            "clinical": {
-                "primary_condition": {"code": "E11", "prevalence": 1.0}
-            }
+def profile_manager(_session_profile_manager, temp_db):
+    """Shared ProfileManager; each test's writes are rolled back by temp_db."""
+    return _session_profile_manager
+
+
+# Serialized once; every json.loads() yields an independent deep copy
+_SAMPLE_PROFILE_SPEC_JSON = json.dumps({
+    "profile": {
+        "id": "test-profile",
+        "generation": {"count": 100, "seed": 42},
+        "demographics": {
+            "source": "populationsim",
+            "reference": {"type": "county", "fips": "48201"}
+        },
+        "clinical": {
+            "primary_condition": {"code": "E11", "prevalence": 1.0}
         }
     }
+})
+
+
+@pytest.fixture
+def sample_profile_spec():
+    """Sample profile specification for testing."""
+    return json.loads(_SAMPLE_PROFILE_SPEC_JSON)
 
 
 # =============================================================================
@@ -73,6 +99,39 @@ class TestSaveProfile:
         assert profile_id.startswith("profile-")
         assert len(profile_id) == 16  # "profile-" + 8 hex chars
     
+    def test_save_profile_ids_unique_across_restarts(self, tmp_path, sample_profile_spec):
+        """Test that a restarted process does not reuse profile IDs."""
+        db_path = tmp_path / "profiles.duckdb"
+        save_script = (
+            "import sys, duckdb\n"
+            "from healthsim.state.profile_manager import ProfileManager\n"
+            "conn = duckdb.connect(sys.argv[1])\n"
+            "manager = ProfileManager(conn)\n"
+            "for i in range(50):\n"
+            "    print(manager.save_profile(name=f'{sys.argv[2]}-{i}', profile_spec={}))\n"
+            "conn.close()\n"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    
+        # Each run saves more profiles than the seconds between the runs
+        ids = [
+            profile_id
+            for name in ("first", "second")
+            for profile_id in subprocess.run(
+                [sys.executable, "-c", save_script, str(db_path), name],
+                capture_output=True, text=True, check=True, env=env,
+            ).stdout.split()
+        ]
+    
+        conn = duckdb.connect(str(db_path))
+        try:
+            stored = {row[0] for row in conn.execute("SELECT id FROM profiles").fetchall()}
+        finally:
+            conn.close()
+        assert len(ids) == 100
+        assert stored == set(ids)
+        assert all(len(profile_id) == 16 for profile_id in ids)
+    
     def test_save_profile_with_tags(self, profile_manager, sample_profile_spec):
         """Test saving a profile with tags."""
         profile_id = profile_manager.save_profile(
@@ -110,6 +169,20 @@ class TestSaveProfile:
                 profile_spec=sample_profile_spec
             )
     
+    def test_save_profile_duplicate_keeps_original(self, profile_manager, sample_profile_spec):
+        """Test a rejected duplicate leaves the original profile and its tags intact."""
+        profile_id = profile_manager.save_profile(
+            name="original", profile_spec=sample_profile_spec, tags=["kept"]
+        )
+        
+        with pytest.raises(ValueError, match="already exists"):
+            profile_manager.save_profile(
+                name="original", profile_spec={"profile": {}}, tags=["dropped"]
+            )
+        
+        assert profile_manager.load_profile("original").id == profile_id
+        assert profile_manager.list_profiles(tags=["dropped"]) == []
+    
     def test_save_profile_with_metadata(self, profile_manager, sample_profile_spec):
         """Test saving a profile with metadata."""
         metadata = {"author": "test", "version": "1.0"}
@@ -152,6 +225,29 @@ class TestLoadProfile:
         with pytest.raises(ValueError, match="not found"):
             profile_manager.load_profile("nonexistent-profile")
     
+    def test_load_repeated_returns_independent_records(self, profile_manager, sample_profile_spec):
+        """Test repeated (cached) loads never share the decoded spec."""
+        profile_manager.save_profile(name="cached", profile_spec=sample_profile_spec)
+        
+        first = profile_manager.load_profile("cached")
+        first.profile_spec["profile"]["generation"]["count"] = 1
+        second = profile_manager.load_profile("cached")
+        
+        assert second.profile_spec["profile"]["generation"]["count"] == 100
+    
+    def test_load_after_update_and_delete(self, profile_manager, sample_profile_spec):
+        """Test cached loads reflect later updates and deletes."""
+        profile_id = profile_manager.save_profile(name="changing", profile_spec=sample_profile_spec)
+        profile_manager.load_profile("changing")
+        profile_manager.load_profile(profile_id)
+        
+        profile_manager.update_profile("changing", description="Changed")
+        assert profile_manager.load_profile(profile_id).description == "Changed"
+        
+        profile_manager.delete_profile(profile_id)
+        with pytest.raises(ValueError, match="not found"):
+            profile_manager.load_profile("changing")
+    
     def test_load_returns_profile_record(self, profile_manager, sample_profile_spec):
         """Test that load returns a ProfileRecord."""
         profile_manager.save_profile(
@@ -169,6 +265,7 @@ class TestLoadProfile:
         assert profile.version == 1
         assert profile.tags == ["test"]
         assert isinstance(profile.created_at, datetime)
+        assert not hasattr(profile, "__dict__")  # slotted record
 
 
 class TestUpdateProfile:
@@ -181,7 +278,7 @@ class TestUpdateProfile:
             profile_spec=sample_profile_spec
         )
         
-        new_spec = dict(sample_profile_spec)
+        new_spec = json.loads(_SAMPLE_PROFILE_SPEC_JSON)
         new_spec["profile"]["generation"]["count"] = 200
         
         updated = profile_manager.update_profile(
@@ -237,6 +334,32 @@ class TestUpdateProfile:
         )
         
         assert updated.version == 1  # Version unchanged
+    
+    def test_update_description_keeps_other_fields(self, profile_manager, sample_profile_spec):
+        """Test a description-only update leaves spec, tags and metadata as saved."""
+        profile_manager.save_profile(
+            name="partial",
+            profile_spec=sample_profile_spec,
+            tags=["kept"],
+            metadata={"author": "test"}
+        )
+    
+        updated = profile_manager.update_profile("partial", description="New")
+    
+        assert updated.description == "New"
+        assert updated.version == 2
+        assert updated.profile_spec == sample_profile_spec
+        assert updated.tags == ["kept"]
+        assert updated.metadata == {"author": "test"}
+    
+    def test_update_nothing_without_version_bump(self, profile_manager, sample_profile_spec):
+        """Test an empty update without a version bump returns the profile unchanged."""
+        profile_manager.save_profile(name="untouched", profile_spec=sample_profile_spec)
+    
+        updated = profile_manager.update_profile("untouched", bump_version=False)
+    
+        assert updated.version == 1
+        assert updated.profile_spec == sample_profile_spec
 
 
 class TestDeleteProfile:
@@ -278,6 +401,31 @@ class TestDeleteProfile:
         # Delete should remove both
         result = profile_manager.delete_profile("with-executions")
         assert result is True
+    
+    def test_delete_blocked_by_executions_keeps_tags(self, tmp_path, sample_profile_spec):
+        """Test a delete refused by the schema's foreign keys leaves tags in place."""
+        conn = duckdb.connect(str(tmp_path / "schema.duckdb"))
+        apply_schema(conn)
+        manager = ProfileManager(conn)
+        profile_id = manager.save_profile(
+            name="kept", profile_spec=sample_profile_spec, tags=["diabetes"]
+        )
+        manager.record_execution(profile_id=profile_id, count=10)
+        
+        with pytest.raises(duckdb.ConstraintException):
+            manager.delete_profile("kept", delete_executions=False)
+        
+        assert [p.name for p in manager.list_profiles(tags=["diabetes"])] == ["kept"]
+        conn.close()
+    
+    def test_delete_name_matching_other_id(self, profile_manager, sample_profile_spec):
+        """Test a name equal to another profile's ID deletes only one profile."""
+        first_id = profile_manager.save_profile(name="first", profile_spec=sample_profile_spec)
+        profile_manager.save_profile(name=first_id, profile_spec=sample_profile_spec)
+        
+        assert profile_manager.delete_profile(first_id) is True
+        
+        assert len(profile_manager.list_profiles()) == 1
 
 
 class TestListProfiles:
@@ -294,6 +442,28 @@ class TestListProfiles:
         assert len(profiles) == 3
         assert all(isinstance(p, ProfileSummary) for p in profiles)
     
+    def test_iter_profiles_matches_list(self, profile_manager, sample_profile_spec):
+        """Test iter_profiles yields the same summaries list_profiles returns."""
+        profile_manager.save_profile(name="iter-1", profile_spec=sample_profile_spec, tags=["a"])
+        profile_manager.save_profile(name="iter-2", profile_spec=sample_profile_spec)
+        
+        summaries = profile_manager.iter_profiles(tags=["a"])
+        
+        assert not isinstance(summaries, list)
+        assert list(summaries) == profile_manager.list_profiles(tags=["a"])
+    
+    def test_iter_profiles_fetches_in_batches(
+        self, profile_manager, sample_profile_spec, monkeypatch
+    ):
+        """Test iter_profiles yields every row when they span several fetches."""
+        monkeypatch.setattr("healthsim.state.profile_manager._LIST_PROFILES_BATCH", 2)
+        for i in range(5):
+            profile_manager.save_profile(name=f"batch-{i}", profile_spec=sample_profile_spec)
+        
+        names = [p.name for p in profile_manager.iter_profiles()]
+        
+        assert sorted(names) == [f"batch-{i}" for i in range(5)]
+    
     def test_list_by_product(self, profile_manager, sample_profile_spec):
         """Test filtering by product."""
         profile_manager.save_profile(
@@ -322,6 +492,27 @@ class TestListProfiles:
         assert len(diabetic) == 1
         assert diabetic[0].name == "diabetic"
     
+    def test_list_by_tags_before_limit(self, profile_manager, sample_profile_spec):
+        """Test tag filtering happens before the result limit is applied."""
+        profile_manager.save_profile(
+            name="tagged", profile_spec=sample_profile_spec, tags=["rare"]
+        )
+        profile_manager.save_profile(name="untagged", profile_spec=sample_profile_spec)
+        
+        tagged = profile_manager.list_profiles(tags=["rare"], limit=1)
+        
+        assert [p.name for p in tagged] == ["tagged"]
+    
+    def test_list_by_tags_after_update(self, profile_manager, sample_profile_spec):
+        """Test tag filtering follows updated tags."""
+        profile_manager.save_profile(
+            name="retagged", profile_spec=sample_profile_spec, tags=["old"]
+        )
+        profile_manager.update_profile("retagged", tags=["new"])
+        
+        assert profile_manager.list_profiles(tags=["old"]) == []
+        assert [p.name for p in profile_manager.list_profiles(tags=["new"])] == ["retagged"]
+    
     def test_list_with_search(self, profile_manager, sample_profile_spec):
         """Test searching profiles."""
         profile_manager.save_profile(
@@ -340,6 +531,15 @@ class TestListProfiles:
         assert len(harris) == 1
         assert harris[0].name == "harris-county-diabetic"
     
+    def test_list_search_is_literal(self, profile_manager, sample_profile_spec):
+        """Test LIKE wildcards in the search text match literally."""
+        profile_manager.save_profile(name="100%-coverage", profile_spec=sample_profile_spec)
+        profile_manager.save_profile(name="100-coverage", profile_spec=sample_profile_spec)
+        
+        matches = profile_manager.list_profiles(search="100%")
+        
+        assert [p.name for p in matches] == ["100%-coverage"]
+    
     def test_list_includes_execution_count(self, profile_manager, sample_profile_spec):
         """Test that list includes execution count."""
         profile_id = profile_manager.save_profile(
@@ -354,6 +554,22 @@ class TestListProfiles:
         profiles = profile_manager.list_profiles()
         
         assert profiles[0].execution_count == 2
+    
+    def test_list_execution_counts_from_batch(self, profile_manager, sample_profile_spec):
+        """Test batched executions update each profile's count and last run."""
+        first = profile_manager.save_profile(name="batch-a", profile_spec=sample_profile_spec)
+        second = profile_manager.save_profile(name="batch-b", profile_spec=sample_profile_spec)
+        
+        profile_manager.record_executions([
+            {"profile_id": first},
+            {"profile_id": first},
+            {"profile_id": second},
+        ])
+        
+        summaries = {p.name: p for p in profile_manager.list_profiles()}
+        assert summaries["batch-a"].execution_count == 2
+        assert summaries["batch-b"].execution_count == 1
+        assert isinstance(summaries["batch-a"].last_executed, datetime)
 
 
 # =============================================================================
@@ -431,6 +647,29 @@ class TestRecordExecution:
         executions = profile_manager.get_executions(profile_id)
         assert executions[0].status == "failed"
         assert executions[0].error_message == "Test error message"
+    
+    def test_record_executions_batch(self, profile_manager, sample_profile_spec):
+        """Test recording several executions in one call."""
+        profile_id = profile_manager.save_profile(
+            name="batch-test",
+            profile_spec=sample_profile_spec
+        )
+        
+        exec_ids = profile_manager.record_executions([
+            {"profile_id": profile_id, "count": 10, "seed": 1},
+            {"profile_id": profile_id, "count": 20, "metadata": {"run": 2}},
+        ])
+        
+        assert len(exec_ids) == 2
+        assert exec_ids[0] < exec_ids[1]
+        executions = profile_manager.get_executions(profile_id)
+        assert [e.count for e in executions] == [20, 10]
+        assert executions[0].metadata == {"run": 2}
+        assert executions[1].seed == 1
+    
+    def test_record_executions_empty(self, profile_manager):
+        """Test recording an empty batch is a no-op."""
+        assert profile_manager.record_executions([]) == []
 
 
 class TestGetExecutions:
@@ -460,8 +699,10 @@ class TestGetExecutions:
             profile_spec=sample_profile_spec
         )
         
-        for i in range(5):
-            profile_manager.record_execution(profile_id=profile_id, count=i, duration_ms=100)
+        profile_manager.record_executions([
+            {"profile_id": profile_id, "count": i, "duration_ms": 100}
+            for i in range(5)
+        ])
         
         executions = profile_manager.get_executions(profile_id, limit=2)
         
@@ -492,6 +733,17 @@ class TestGetExecutions:
         assert exec_record.count == 50
         assert exec_record.duration_ms == 750
         assert exec_record.status == "completed"
+    
+    def test_get_executions_none_recorded(self, profile_manager, sample_profile_spec):
+        """Test a profile without executions returns an empty history."""
+        profile_manager.save_profile(name="never-run", profile_spec=sample_profile_spec)
+        
+        assert profile_manager.get_executions("never-run") == []
+    
+    def test_get_executions_unknown_profile_raises(self, profile_manager):
+        """Test requesting history for an unknown profile raises ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            profile_manager.get_executions("no-such-profile")
 
 
 class TestGetCohortProfile:
@@ -516,6 +768,18 @@ class TestGetCohortProfile:
         assert profile is not None
         assert profile.name == "cohort-profile"
     
+    def test_get_profile_for_cohort_after_delete(self, profile_manager, sample_profile_spec):
+        """Test a cohort lookup is forgotten once its profile is deleted."""
+        profile_id = profile_manager.save_profile(
+            name="deleted-source", profile_spec=sample_profile_spec
+        )
+        profile_manager.record_execution(profile_id=profile_id, cohort_id="cohort-gone")
+        assert profile_manager.get_cohort_profile("cohort-gone").id == profile_id
+        
+        profile_manager.delete_profile(profile_id)
+        
+        assert profile_manager.get_cohort_profile("cohort-gone") is None
+    
     def test_get_profile_for_unknown_cohort(self, profile_manager):
         """Test that unknown cohort returns None."""
         profile = profile_manager.get_cohort_profile("unknown-cohort")
@@ -544,6 +808,23 @@ class TestGetExecutionSpec:
         assert spec["profile"]["generation"]["seed"] == 42
         assert spec["profile"]["generation"]["count"] == 200
     
+    def test_get_spec_repeated_follows_profile_update(self, profile_manager, sample_profile_spec):
+        """Test repeated spec lookups are independent and see profile updates."""
+        profile_id = profile_manager.save_profile(
+            name="spec-cache", profile_spec=sample_profile_spec
+        )
+        exec_id = profile_manager.record_execution(profile_id=profile_id, seed=7, count=10)
+        
+        first = profile_manager.get_execution_spec(exec_id)
+        first["profile"]["generation"]["seed"] = 0
+        assert profile_manager.get_execution_spec(exec_id)["profile"]["generation"]["seed"] == 7
+        
+        profile_manager.update_profile("spec-cache", profile_spec={"profile": {"id": "updated"}})
+        updated = profile_manager.get_execution_spec(exec_id)
+        
+        assert updated["profile"]["id"] == "updated"
+        assert updated["profile"]["generation"] == {"seed": 7, "count": 10}
+    
     def test_get_spec_nonexistent_raises(self, profile_manager):
         """Test that nonexistent execution raises ValueError."""
         with pytest.raises(ValueError, match="not found"):
@@ -21,115 +21,187 @@ from healthsim.generation.handlers import (
 )
 
 
-class TestPatientSimHandlers:
-    """Tests for PatientSim handlers."""
-    
-    def test_creation(self):
-        """Test creating handlers."""
-        handlers = PatientSimHandlers(seed=42)
-        assert handlers.seed == 42
-    
-    def test_handle_diagnosis(self):
-        """Test diagnosis handler."""
-        handlers = PatientSimHandlers(seed=42)
-        
-        entity = {"patient_id": "P001", "name": "Test Patient"}
-        event = TimelineEvent(
+@pytest.fixture(scope="module")
+def _module_handlers():
+    """One handlers instance per product, shared by every test in the module."""
+    return {
+        cls: cls(seed=42)
+        for cls in (PatientSimHandlers, MemberSimHandlers, RxMemberSimHandlers, TrialSimHandlers)
+    }
+
+
+@pytest.fixture(scope="module")
+def _registered_engine():
+    """JourneyEngine with every product's handlers, registered once per module."""
+    engine = JourneyEngine(seed=42)
+    register_all_handlers(engine, seed=42)
+    return engine
+
+
+@pytest.fixture
+def registered_engine(_registered_engine):
+    """Fork of the registered engine with its handlers but a fresh RNG and timelines."""
+    return _registered_engine.fork()
+
+
+@pytest.fixture
+def make_event():
+    """Factory for TimelineEvents that differ only in type, name, date and parameters."""
+    def _make(event_type, event_name, scheduled_date=date(2025, 1, 1), parameters=None):
+        return TimelineEvent(
             timeline_event_id="e1",
             journey_id="j1",
             event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 1),
-            event_type="diagnosis",
-            event_name="Diabetes Diagnosis",
-            result={"parameters": {"icd10": "E11.9", "description": "Type 2 diabetes"}}
+            scheduled_date=scheduled_date,
+            event_type=event_type,
+            event_name=event_name,
+            result={"parameters": parameters} if parameters is not None else {},
         )
-        
-        result = handlers.handle_diagnosis(entity, event, {})
-        
-        assert result["patient_id"] == "P001"
-        assert result["icd10"] == "E11.9"
-        assert result["clinical_status"] == "active"
-        assert "condition_id" in result
+    return _make
+
+
+def _reseeded(handlers):
+    """Reset a shared instance's RNG so each test draws as if it were freshly built."""
+    handlers._rng.seed(handlers.seed)
+    return handlers
+
+
+@pytest.fixture
+def ps_handlers(_module_handlers):
+    """Shared PatientSimHandlers(seed=42)."""
+    return _reseeded(_module_handlers[PatientSimHandlers])
+
+
+@pytest.fixture
+def ms_handlers(_module_handlers):
+    """Shared MemberSimHandlers(seed=42)."""
+    return _reseeded(_module_handlers[MemberSimHandlers])
+
+
+@pytest.fixture
+def ts_handlers(_module_handlers):
+    """Shared TrialSimHandlers(seed=42)."""
+    return _reseeded(_module_handlers[TrialSimHandlers])
+
+
+# (handlers, entity, event_type, parameters, expected fields, required keys)
+HANDLER_CASES = [
+    pytest.param(
+        PatientSimHandlers, {"patient_id": "P001", "name": "Test Patient"}, "diagnosis",
+        {"icd10": "E11.9", "description": "Type 2 diabetes"},
+        {"patient_id": "P001", "icd10": "E11.9", "clinical_status": "active"},
+        {"condition_id"},
+        id="patientsim-diagnosis",
+    ),
+    pytest.param(
+        PatientSimHandlers, {"patient_id": "P001"}, "encounter", None,
+        {"patient_id": "P001", "encounter_type": "outpatient", "status": "completed"},
+        set(),
+        id="patientsim-encounter",
+    ),
+    pytest.param(
+        PatientSimHandlers, {"patient_id": "P001"}, "lab_order",
+        {"loinc": "4548-4", "test_name": "Hemoglobin A1c"},
+        {"patient_id": "P001", "loinc": "4548-4", "status": "ordered"},
+        set(),
+        id="patientsim-lab_order",
+    ),
+    pytest.param(
+        PatientSimHandlers, {"patient_id": "P001"}, "medication_order",
+        {"rxnorm": "860975", "drug_name": "Metformin 500 MG"},
+        {"patient_id": "P001", "rxnorm": "860975", "status": "active"},
+        set(),
+        id="patientsim-medication_order",
+    ),
+    pytest.param(
+        MemberSimHandlers, {"member_id": "M001"}, "new_enrollment", None,
+        {"member_id": "M001", "status": "active"},
+        {"plan"},
+        id="membersim-new_enrollment",
+    ),
+    pytest.param(
+        MemberSimHandlers, {"member_id": "M001"}, "gap_identified",
+        {"measure": "CDC", "description": "A1C not completed"},
+        {"member_id": "M001", "measure": "CDC", "status": "open"},
+        set(),
+        id="membersim-gap_identified",
+    ),
+    pytest.param(
+        RxMemberSimHandlers, {"rx_member_id": "RX001"}, "new_rx",
+        {"rxnorm": "860975", "drug_name": "Metformin"},
+        {"member_id": "RX001", "rxnorm": "860975", "status": "active"},
+        set(),
+        id="rxmembersim-new_rx",
+    ),
+    pytest.param(
+        RxMemberSimHandlers, {"rx_member_id": "RX001"}, "fill", None,
+        {"member_id": "RX001", "status": "dispensed"},
+        {"pharmacy"},
+        id="rxmembersim-fill",
+    ),
+    pytest.param(
+        RxMemberSimHandlers, {"rx_member_id": "RX001"}, "therapy_start",
+        {"therapy_class": "antidiabetic", "indication": "Type 2 Diabetes"},
+        {"member_id": "RX001", "therapy_class": "antidiabetic", "status": "active"},
+        set(),
+        id="rxmembersim-therapy_start",
+    ),
+    pytest.param(
+        TrialSimHandlers, {"subject_id": "SUBJ-001"}, "adverse_event",
+        {"term": "Nausea", "severity": "Mild"},
+        {"subject_id": "SUBJ-001", "ae_term": "Nausea", "serious": False},
+        set(),
+        id="trialsim-adverse_event",
+    ),
+]
+
+
+class TestHandlerResults:
+    """Tests for the fields each product handler sets on its result."""
     
-    def test_handle_encounter(self):
-        """Test encounter handler."""
-        handlers = PatientSimHandlers(seed=42)
-        
-        entity = {"patient_id": "P001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 15), event_type="encounter",
-            event_name="Follow-up Visit"
-        )
-        
-        result = handlers.handle_encounter(entity, event, {})
-        
-        assert result["patient_id"] == "P001"
-        assert result["encounter_type"] == "outpatient"
-        assert result["status"] == "completed"
+    @pytest.mark.parametrize(
+        "handler_cls,entity,event_type,parameters,expected,required_keys", HANDLER_CASES
+    )
+    def test_handler_result(
+        self, _module_handlers, make_event,
+        handler_cls, entity, event_type, parameters, expected, required_keys,
+    ):
+        """Test a handler's result carries the expected fields."""
+        handlers = _reseeded(_module_handlers[handler_cls])
+        event = make_event(event_type, event_type.replace("_", " ").title(), parameters=parameters)
+        
+        result = getattr(handlers, f"handle_{event_type}")(entity, event, {})
+        
+        assert expected.items() <= result.items()
+        assert required_keys <= result.keys()
+
+
+class TestPatientSimHandlers:
+    """Tests for PatientSim handlers."""
     
-    def test_handle_lab_order(self):
-        """Test lab order handler."""
-        handlers = PatientSimHandlers(seed=42)
-        
-        entity = {"patient_id": "P001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 1), event_type="lab_order",
-            event_name="A1C Test",
-            result={"parameters": {"loinc": "4548-4", "test_name": "Hemoglobin A1c"}}
-        )
-        
-        result = handlers.handle_lab_order(entity, event, {})
-        
-        assert result["patient_id"] == "P001"
-        assert result["loinc"] == "4548-4"
-        assert result["status"] == "ordered"
+    def test_creation(self, ps_handlers):
+        """Test creating handlers."""
+        assert ps_handlers.seed == 42
     
-    def test_handle_lab_result(self):
+    def test_handle_lab_result(self, ps_handlers, make_event):
         """Test lab result handler generates realistic values."""
-        handlers = PatientSimHandlers(seed=42)
-        
         # Diabetic patient
         entity = {"patient_id": "P001", "conditions": ["E11.9"]}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 5), event_type="lab_result",
-            event_name="A1C Result",
-            result={"parameters": {"loinc": "4548-4"}}
+        event = make_event(
+            "lab_result", "A1C Result", date(2025, 1, 5),
+            parameters={"loinc": "4548-4"}
         )
         
-        result = handlers.handle_lab_result(entity, event, {})
+        result = ps_handlers.handle_lab_result(entity, event, {})
         
-        assert result["patient_id"] == "P001"
-        assert result["loinc"] == "4548-4"
+        assert {"patient_id": "P001", "loinc": "4548-4", "unit": "%"}.items() <= result.items()
         assert 4.0 <= result["value"] <= 14.0
-        assert result["unit"] == "%"
-    
-    def test_handle_medication_order(self):
-        """Test medication order handler."""
-        handlers = PatientSimHandlers(seed=42)
-        
-        entity = {"patient_id": "P001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 3), event_type="medication_order",
-            event_name="Start Metformin",
-            result={"parameters": {"rxnorm": "860975", "drug_name": "Metformin 500 MG"}}
-        )
-        
-        result = handlers.handle_medication_order(entity, event, {})
-        
-        assert result["patient_id"] == "P001"
-        assert result["rxnorm"] == "860975"
-        assert result["status"] == "active"
     
-    def test_register_all(self):
+    def test_register_all(self, ps_handlers):
         """Test registering all handlers with engine."""
-        handlers = PatientSimHandlers(seed=42)
         engine = JourneyEngine(seed=42)
         
-        handlers.register_all(engine)
+        ps_handlers.register_all(engine)
         
         # Check handlers are registered
         assert "patientsim" in engine._handlers
@@ -140,188 +212,49 @@ class TestPatientSimHandlers:
 class TestMemberSimHandlers:
     """Tests for MemberSim handlers."""
     
-    def test_handle_new_enrollment(self):
-        """Test enrollment handler."""
-        handlers = MemberSimHandlers(seed=42)
-        
-        entity = {"member_id": "M001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 1), event_type="new_enrollment",
-            event_name="New Enrollment"
-        )
-        
-        result = handlers.handle_new_enrollment(entity, event, {})
-        
-        assert result["member_id"] == "M001"
-        assert result["status"] == "active"
-        assert "plan" in result
-    
-    def test_handle_claim_professional(self):
-        """Test professional claim handler."""
-        handlers = MemberSimHandlers(seed=42)
-        
+    @pytest.mark.parametrize("event_type,claim_type,parameters,expected", [
+        ("claim_professional", "professional", None, {}),
+        ("claim_pharmacy", "pharmacy",
+         {"drug_name": "Metformin 500mg", "quantity": 30}, {"quantity": 30}),
+    ], ids=["professional", "pharmacy"])
+    def test_handle_claim(
+        self, ms_handlers, make_event, event_type, claim_type, parameters, expected
+    ):
+        """Test claim handlers set the claim type and consistent amounts."""
         entity = {"member_id": "M001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 15), event_type="claim_professional",
-            event_name="Office Visit Claim"
-        )
+        event = make_event(event_type, "Claim", date(2025, 1, 15), parameters=parameters)
         
-        result = handlers.handle_claim_professional(entity, event, {})
+        result = getattr(ms_handlers, f"handle_{event_type}")(entity, event, {})
         
-        assert result["member_id"] == "M001"
-        assert result["claim_type"] == "professional"
+        expected = {"member_id": "M001", "claim_type": claim_type, **expected}
+        assert expected.items() <= result.items()
         assert result["billed_amount"] > 0
         assert result["paid_amount"] <= result["allowed_amount"]
-    
-    def test_handle_claim_pharmacy(self):
-        """Test pharmacy claim handler."""
-        handlers = MemberSimHandlers(seed=42)
-        
-        entity = {"member_id": "M001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 5), event_type="claim_pharmacy",
-            event_name="Rx Claim",
-            result={"parameters": {"drug_name": "Metformin 500mg", "quantity": 30}}
-        )
-        
-        result = handlers.handle_claim_pharmacy(entity, event, {})
-        
-        assert result["member_id"] == "M001"
-        assert result["claim_type"] == "pharmacy"
-        assert result["quantity"] == 30
-    
-    def test_handle_gap_identified(self):
-        """Test quality gap handler."""
-        handlers = MemberSimHandlers(seed=42)
-        
-        entity = {"member_id": "M001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 2, 1), event_type="gap_identified",
-            event_name="A1C Gap",
-            result={"parameters": {"measure": "CDC", "description": "A1C not completed"}}
-        )
-        
-        result = handlers.handle_gap_identified(entity, event, {})
-        
-        assert result["member_id"] == "M001"
-        assert result["measure"] == "CDC"
-        assert result["status"] == "open"
-
-
-class TestRxMemberSimHandlers:
-    """Tests for RxMemberSim handlers."""
-    
-    def test_handle_new_rx(self):
-        """Test new prescription handler."""
-        handlers = RxMemberSimHandlers(seed=42)
-        
-        entity = {"rx_member_id": "RX001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 3), event_type="new_rx",
-            event_name="New Rx",
-            result={"parameters": {"rxnorm": "860975", "drug_name": "Metformin"}}
-        )
-        
-        result = handlers.handle_new_rx(entity, event, {})
-        
-        assert result["member_id"] == "RX001"
-        assert result["rxnorm"] == "860975"
-        assert result["status"] == "active"
-    
-    def test_handle_fill(self):
-        """Test fill handler."""
-        handlers = RxMemberSimHandlers(seed=42)
-        
-        entity = {"rx_member_id": "RX001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 5), event_type="fill",
-            event_name="Initial Fill"
-        )
-        
-        result = handlers.handle_fill(entity, event, {})
-        
-        assert result["member_id"] == "RX001"
-        assert result["status"] == "dispensed"
-        assert "pharmacy" in result
-    
-    def test_handle_therapy_start(self):
-        """Test therapy start handler."""
-        handlers = RxMemberSimHandlers(seed=42)
-        
-        entity = {"rx_member_id": "RX001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 5), event_type="therapy_start",
-            event_name="Start Antidiabetic",
-            result={"parameters": {"therapy_class": "antidiabetic", "indication": "Type 2 Diabetes"}}
-        )
-        
-        result = handlers.handle_therapy_start(entity, event, {})
-        
-        assert result["member_id"] == "RX001"
-        assert result["therapy_class"] == "antidiabetic"
-        assert result["status"] == "active"
 
 
 class TestTrialSimHandlers:
     """Tests for TrialSim handlers."""
     
-    def test_handle_screening(self):
+    def test_handle_screening(self, ts_handlers, make_event):
         """Test screening handler."""
-        handlers = TrialSimHandlers(seed=42)
-        
         entity = {"subject_id": "SUBJ-001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 1), event_type="screening",
-            event_name="Screening Visit"
-        )
+        event = make_event("screening", "Screening Visit")
         
-        result = handlers.handle_screening(entity, event, {})
+        result = ts_handlers.handle_screening(entity, event, {})
         
         assert result["subject_id"] == "SUBJ-001"
         assert result["screen_status"] in ["passed", "failed"]
         assert "site" in result
     
-    def test_handle_randomization(self):
+    def test_handle_randomization(self, ts_handlers, make_event):
         """Test randomization handler."""
-        handlers = TrialSimHandlers(seed=42)
-        
         entity = {"subject_id": "SUBJ-001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 1, 8), event_type="randomization",
-            event_name="Randomization"
-        )
+        event = make_event("randomization", "Randomization", date(2025, 1, 8))
         
-        result = handlers.handle_randomization(entity, event, {})
+        result = ts_handlers.handle_randomization(entity, event, {})
         
         assert result["subject_id"] == "SUBJ-001"
         assert result["treatment_arm"] in ["Treatment", "Placebo"]
-    
-    def test_handle_adverse_event(self):
-        """Test adverse event handler."""
-        handlers = TrialSimHandlers(seed=42)
-        
-        entity = {"subject_id": "SUBJ-001"}
-        event = TimelineEvent(
-            timeline_event_id="e1", journey_id="j1", event_definition_id="ed1",
-            scheduled_date=date(2025, 2, 15), event_type="adverse_event",
-            event_name="AE Report",
-            result={"parameters": {"term": "Nausea", "severity": "Mild"}}
-        )
-        
-        result = handlers.handle_adverse_event(entity, event, {})
-        
-        assert result["subject_id"] == "SUBJ-001"
-        assert result["ae_term"] == "Nausea"
-        assert result["serious"] is False
 
 
 class TestConvenienceFunctions:
@@ -339,26 +272,33 @@ class TestConvenienceFunctions:
         assert isinstance(rx, RxMemberSimHandlers)
         assert isinstance(ts, TrialSimHandlers)
     
-    def test_register_all_handlers(self):
+    def test_register_all_handlers(self, registered_engine):
         """Test registering all handlers."""
+        # Check all products registered
+        assert "patientsim" in registered_engine._handlers
+        assert "membersim" in registered_engine._handlers
+        assert "rxmembersim" in registered_engine._handlers
+        assert "trialsim" in registered_engine._handlers
+    
+    def test_register_all_handlers_for_products(self):
+        """Test registering handlers for selected products only."""
         engine = JourneyEngine(seed=42)
-        register_all_handlers(engine, seed=42)
+        register_all_handlers(engine, seed=42, products=["patientsim"])
         
-        # Check all products registered
-        assert "patientsim" in engine._handlers
-        assert "membersim" in engine._handlers
-        assert "rxmembersim" in engine._handlers
-        assert "trialsim" in engine._handlers
+        assert list(engine._handlers) == ["patientsim"]
+    
+    def test_register_all_handlers_unknown_product(self):
+        """Test registering handlers for an unknown product raises."""
+        with pytest.raises(ValueError, match="Unknown product"):
+            register_all_handlers(JourneyEngine(seed=42), products=["nosuchsim"])
 
 
 class TestEndToEndWithHandlers:
     """End-to-end tests with handlers and journey engine."""
     
-    def test_diabetic_journey_execution(self):
+    def test_diabetic_journey_execution(self, registered_engine):
         """Test executing diabetic journey with handlers."""
-        # Create engine with handlers
-        engine = JourneyEngine(seed=42)
-        register_all_handlers(engine, seed=42)
+        engine = registered_engine
         
         # Create journey
         journey = create_simple_journey(
@@ -385,3 +325,27 @@ class TestEndToEndWithHandlers:
         assert len(results) == 2
         assert results[0]["status"] == "executed"
         assert results[1]["status"] == "executed"
+    
+    def test_event_results_independent_of_earlier_events(self, registered_engine):
+        """Test an event's random draws don't depend on the events executed before it."""
+        visit = {"event_id": "visit", "name": "Visit", "event_type": "encounter",
+                 "product": "patientsim", "delay": {"days": 0}}
+        med = {"event_id": "med", "name": "Metformin", "event_type": "medication_order",
+               "product": "patientsim", "delay": {"days": 3},
+               "parameters": {"rxnorm": "860975"}}
+        
+        def execute(events):
+            journey = create_simple_journey("test-order", "Test Order", events=events,
+                                            products=["patientsim"])
+            patient = {"patient_id": "P001"}
+            timeline = registered_engine.create_timeline(
+                patient, "patient", journey, date(2025, 1, 1)
+            )
+            return registered_engine.execute_timeline(
+                timeline, patient, up_to_date=date(2025, 1, 10)
+            )
+        
+        alone = execute([med])
+        after_visit = execute([visit, med])
+        
+        assert alone[-1]["outputs"] == after_visit[-1]["outputs"]
@@ -10,7 +10,7 @@ The Oswald Family:
 """
 
 import pytest
-from datetime import date, timedelta
+from datetime import date
 
 from healthsim.generation import (
     # Profile
@@ -18,13 +18,10 @@ from healthsim.generation import (
     ProfileSpecification,
     # Journey
     JourneyEngine,
-    JourneySpecification,
-    Timeline,
     create_simple_journey,
     get_journey_template,
     # Triggers
     CrossProductCoordinator,
-    LinkedEntity,
     # Handlers
     register_all_handlers,
 )
@@ -113,32 +110,34 @@ SARAH_OSWALD_PROFILE = {
 # Test Class
 # =============================================================================
 
+@pytest.fixture(scope="module")
+def _registered_engine():
+    """An engine with all handlers registered, built once per module."""
+    engine = JourneyEngine(seed=42)
+    register_all_handlers(engine, seed=42)
+    return engine
+
+
 class TestOswaldFamilyIntegration:
     """Integration tests for Oswald Family scenario."""
     
     @pytest.fixture
-    def coordinator(self):
+    def coordinator(self, _registered_engine):
         """Create a coordinator with all handlers registered."""
         coord = CrossProductCoordinator()
         
-        # Create engines for each product
-        engines = {
-            "patientsim": JourneyEngine(seed=42),
-            "membersim": JourneyEngine(seed=42),
-            "rxmembersim": JourneyEngine(seed=42),
-        }
-        
-        # Register all handlers with each engine
-        for product, engine in engines.items():
-            register_all_handlers(engine, seed=42)
+        # Each test gets forks with the registered handlers but a fresh
+        # RNG and no active timelines; handler draws are keyed per event
+        engines = {}
+        for product in ("patientsim", "membersim", "rxmembersim"):
+            engine = _registered_engine.fork()
+            engines[product] = engine
             coord.register_product_engine(product, engine)
         
         return coord, engines
     
     def test_mark_profile_generation(self):
         """Test generating Mark's profile."""
-        from healthsim.generation import ProfileSpecification
-        
         # Create simplified profile spec for testing
         # Use normal with tight bounds for deterministic-like results
         spec = ProfileSpecification(
@@ -209,11 +208,8 @@ class TestOswaldFamilyIntegration:
         assert all(r["status"] == "executed" for r in results)
         
         # Verify event sequence
-        event_types = [r["event_type"] for r in results]
-        assert "diagnosis" in event_types
-        assert "lab_order" in event_types
-        assert "medication_order" in event_types
-        assert "new_enrollment" in event_types
+        event_types = {r["event_type"] for r in results}
+        assert {"diagnosis", "lab_order", "medication_order", "new_enrollment"} <= event_types
     
     def test_mark_claims_generation(self, coordinator):
         """Test that Mark's clinical events generate claims."""
@@ -246,7 +242,8 @@ class TestOswaldFamilyIntegration:
         assert len(results) == 2
         
         # Check claim has proper structure
-        claim_result = next(r for r in results if r["event_type"] == "claim_professional")
+        results_by_type = {r["event_type"]: r for r in results}
+        claim_result = results_by_type["claim_professional"]
         assert claim_result["status"] == "executed"
         assert "outputs" in claim_result
     
@@ -300,11 +297,12 @@ class TestOswaldFamilyIntegration:
         coord.add_timeline(sarah, "patientsim", sarah_timeline)
         
         # Execute both
-        mark_results = engine.execute_timeline(
-            mark_timeline, {"patient_id": "P-MARK-001"}, date(2025, 1, 31)
-        )
-        sarah_results = engine.execute_timeline(
-            sarah_timeline, {"patient_id": "P-SARAH-001"}, date(2025, 1, 31)
+        mark_results, sarah_results = engine.execute_timelines(
+            [
+                (mark_timeline, {"patient_id": "P-MARK-001"}),
+                (sarah_timeline, {"patient_id": "P-SARAH-001"}),
+            ],
+            date(2025, 1, 31),
         )
         
         assert len(mark_results) == 1
@@ -332,10 +330,8 @@ class TestOswaldFamilyIntegration:
         # Should have multiple events
         assert len(timeline.events) >= 4  # At minimum: dx, a1c, metformin, followup
     
-    def test_reproducibility(self, coordinator):
+    def test_reproducibility(self):
         """Test that same seed produces same results."""
-        coord, engines = coordinator
-        
         journey = create_simple_journey(
             "test", "Test",
             events=[
@@ -346,14 +342,12 @@ class TestOswaldFamilyIntegration:
         
         # First run
         engine1 = JourneyEngine(seed=12345)
-        register_all_handlers(engine1, seed=12345)
         timeline1 = engine1.create_timeline(
             {"patient_id": "P001"}, "patient", journey, date(2025, 1, 1)
         )
         
         # Second run with same seed
         engine2 = JourneyEngine(seed=12345)
-        register_all_handlers(engine2, seed=12345)
         timeline2 = engine2.create_timeline(
             {"patient_id": "P001"}, "patient", journey, date(2025, 1, 1)
         )
@@ -387,8 +381,6 @@ class TestPerformanceBatch:
     
     def test_batch_profile_generation(self):
         """Test generating a batch of profiles."""
-        from healthsim.generation import ProfileSpecification
-        
         spec = ProfileSpecification(
             id="batch-profile",
             name="Batch Profile",
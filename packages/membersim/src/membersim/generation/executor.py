@@ -6,15 +6,21 @@ including plan assignment, subscriber groups, and quality gaps.
 
 from __future__ import annotations
 
+import os
 import random
+import time
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
+from itertools import accumulate
 from typing import TYPE_CHECKING, Any
 
 from healthsim.generation.profile_executor import (
+    PARALLEL_MIN_COUNT,
     ExecutionResult,
     GeneratedEntity,
-    HierarchicalSeedManager,
     ProfileExecutor,
     ValidationMetric,
     ValidationReport,
@@ -30,6 +36,17 @@ if TYPE_CHECKING:
     from membersim.core.member import Member
 
 
+# Common HEDIS measures and their likelihood
+_QUALITY_GAP_MEASURES: tuple[tuple[str, float], ...] = (
+    ("CDC-HbA1c", 0.3),  # Diabetes HbA1c control
+    ("CDC-Eye", 0.4),  # Diabetes eye exam
+    ("BCS", 0.25),  # Breast cancer screening
+    ("COL", 0.35),  # Colorectal cancer screening
+    ("AWC", 0.2),  # Adult well-care
+    ("CIS", 0.15),  # Childhood immunizations
+)
+
+
 @dataclass
 class GeneratedMember(GeneratedEntity):
     """Extended entity with member-specific attributes."""
@@ -122,7 +139,6 @@ class MemberProfileExecutor:
             self.profile = profile
 
         self.seed = seed or self.profile.generation.seed or random.randint(0, 2**31 - 1)
-        self.seed_manager = HierarchicalSeedManager(self.seed)
 
         # Core executor for base entity generation
         self._core_executor = ProfileExecutor(
@@ -130,6 +146,13 @@ class MemberProfileExecutor:
             seed=self.seed,
         )
 
+        # Cumulative weights for plan and relationship sampling
+        coverage = self.profile.coverage
+        self._plan_choices = self._cumulative(coverage.plan_distribution.weights)
+        self._relationship_choices = self._cumulative(
+            coverage.relationship_distribution.weights
+        )
+
     def execute(
         self,
         count_override: int | None = None,
@@ -144,37 +167,81 @@ class MemberProfileExecutor:
         Returns:
             MemberExecutionResult with generated members and validation
         """
-        import time
         start_time = time.time()
 
-        count = count_override or self.profile.generation.count
-        if dry_run:
-            count = min(count, 5)
+        count = self._resolve_count(count_override, dry_run)
 
         # Generate base entities using core executor
         core_result = self._core_executor.execute(count_override=count)
 
+        # Effective dates are relative to one "today" for the whole run
+        today = date.today()
+
         # Extend to members with plan/coverage details
-        members: list[GeneratedMember] = []
-        plan_counts: dict[str, int] = {}
-        relationship_counts: dict[str, int] = {}
-        coverage_counts: dict[str, int] = {}
-
-        for entity in core_result.entities:
-            member = self._extend_to_member(entity)
-            members.append(member)
-
-            # Track distributions
-            if member.plan_type:
-                plan_counts[member.plan_type] = plan_counts.get(member.plan_type, 0) + 1
-            if member.relationship:
-                relationship_counts[member.relationship] = (
-                    relationship_counts.get(member.relationship, 0) + 1
-                )
-            if member.coverage_type:
-                coverage_counts[member.coverage_type] = (
-                    coverage_counts.get(member.coverage_type, 0) + 1
-                )
+        members = [self._extend_to_member(entity, today) for entity in core_result.entities]
+
+        return self._build_result(members, start_time)
+
+    def execute_parallel(
+        self,
+        max_workers: int | None = None,
+        count_override: int | None = None,
+        dry_run: bool = False,
+    ) -> MemberExecutionResult:
+        """Execute the profile, generating members across worker processes.
+
+        Each member depends only on its entity seed, so the members are
+        identical to those from execute(). Batches smaller than
+        PARALLEL_MIN_COUNT are generated in-process.
+
+        Args:
+            max_workers: Worker processes to use (defaults to CPU count)
+            count_override: Override the count from profile
+            dry_run: If True, generate sample only
+
+        Returns:
+            MemberExecutionResult with generated members and validation
+        """
+        start_time = time.time()
+
+        count = self._resolve_count(count_override, dry_run)
+        workers = max_workers or os.cpu_count() or 1
+        if count < PARALLEL_MIN_COUNT or workers < 2:
+            return self.execute(count_override=count_override, dry_run=dry_run)
+
+        today = date.today()
+        chunk_size = -(-count // workers)
+        starts = range(0, count, chunk_size)
+        stops = [min(start + chunk_size, count) for start in starts]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(
+                _generate_member_range,
+                [self] * len(starts),
+                starts,
+                stops,
+                [today] * len(starts),
+            )
+            members = [member for chunk in chunks for member in chunk]
+
+        return self._build_result(members, start_time)
+
+    def _resolve_count(self, count_override: int | None, dry_run: bool) -> int:
+        """Number of members to generate."""
+        count = count_override or self.profile.generation.count
+        if dry_run:
+            count = min(count, 5)
+        return count
+
+    def _build_result(
+        self,
+        members: list[GeneratedMember],
+        start_time: float,
+    ) -> MemberExecutionResult:
+        """Tally and validate generated members into a MemberExecutionResult."""
+        # Track distributions
+        plan_counts = dict(Counter(m.plan_type for m in members if m.plan_type))
+        relationship_counts = dict(Counter(m.relationship for m in members if m.relationship))
+        coverage_counts = dict(Counter(m.coverage_type for m in members if m.coverage_type))
 
         duration = time.time() - start_time
 
@@ -193,31 +260,36 @@ class MemberProfileExecutor:
             coverage_type_distribution=coverage_counts,
         )
 
-    def _extend_to_member(self, entity: GeneratedEntity) -> GeneratedMember:
+    def _extend_to_member(
+        self,
+        entity: GeneratedEntity,
+        today: date | None = None,
+    ) -> GeneratedMember:
         """Extend a base entity to a full member with plan details.
 
         Args:
             entity: Base generated entity
+            today: Reference date for effective dates (default: today)
 
         Returns:
             GeneratedMember with plan and coverage details
         """
-        rng = self.seed_manager.get_entity_rng(entity.index)
+        # The core executor shares our master seed, so entity.seed is
+        # already this entity's hierarchical seed
+        rng = random.Random(entity.seed)
         coverage = self.profile.coverage
 
         # Sample plan type
-        plan_weights = list(coverage.plan_distribution.weights.items())
-        plan_type = self._weighted_choice(plan_weights, rng)
+        plan_type = self._weighted_choice(*self._plan_choices, rng)
 
         # Sample relationship
-        rel_weights = list(coverage.relationship_distribution.weights.items())
-        relationship = self._weighted_choice(rel_weights, rng)
+        relationship = self._weighted_choice(*self._relationship_choices, rng)
 
         # Generate member ID
         member_id = f"MBR{entity.seed % 10000000:07d}"
 
         # Generate effective date (within last 3 years)
-        today = date.today()
+        today = today or date.today()
         days_back = rng.randint(0, 3 * 365)
         effective_date = today - timedelta(days=days_back)
         # Align to first of month
@@ -255,28 +327,37 @@ class MemberProfileExecutor:
             quality_gaps=quality_gaps,
         )
 
+    @staticmethod
+    def _cumulative(weights: dict[str, float]) -> tuple[list[str], list[float]]:
+        """Split weights into values and their running totals.
+
+        Args:
+            weights: Mapping of value to weight
+
+        Returns:
+            Tuple of (values, cumulative weights)
+        """
+        return list(weights), list(accumulate(weights.values()))
+
     def _weighted_choice(
         self,
-        options: list[tuple[str, float]],
+        values: list[str],
+        cumulative: list[float],
         rng: random.Random,
     ) -> str:
         """Select from weighted options.
 
         Args:
-            options: List of (value, weight) tuples
+            values: Options to choose from
+            cumulative: Running total of the option weights
             rng: Random number generator
 
         Returns:
             Selected value
         """
-        total = sum(w for _, w in options)
-        r = rng.random() * total
-        cumulative = 0.0
-        for value, weight in options:
-            cumulative += weight
-            if r <= cumulative:
-                return value
-        return options[-1][0]
+        r = rng.random() * cumulative[-1]
+        index = bisect_left(cumulative, r)
+        return values[min(index, len(values) - 1)]
 
     def _generate_quality_gaps(
         self,
@@ -292,38 +373,25 @@ class MemberProfileExecutor:
         Returns:
             List of gap measure IDs
         """
-        # Common HEDIS measures and their likelihood
-        potential_gaps = [
-            ("CDC-HbA1c", 0.3),  # Diabetes HbA1c control
-            ("CDC-Eye", 0.4),  # Diabetes eye exam
-            ("BCS", 0.25),  # Breast cancer screening
-            ("COL", 0.35),  # Colorectal cancer screening
-            ("AWC", 0.2),  # Adult well-care
-            ("CIS", 0.15),  # Childhood immunizations
-        ]
+        age = entity.age
+        # CDC measures only apply to members with conditions (diabetics)
+        diabetic = bool(getattr(entity, "conditions", None))
+        # Age-appropriate filtering, in _QUALITY_GAP_MEASURES order
+        eligible = (
+            diabetic,
+            diabetic,
+            entity.gender == "F" and age is not None and 50 <= age <= 74,
+            age is not None and age >= 45,
+            True,
+            age is not None and age <= 2,
+        )
 
-        gaps = []
-        for measure, probability in potential_gaps:
-            # Age-appropriate filtering
-            if measure == "BCS" and (
-                entity.gender != "F"
-                or entity.age is None
-                or entity.age < 50
-                or entity.age > 74
-            ):
-                continue
-            if measure == "COL" and (entity.age is None or entity.age < 45):
-                continue
-            if measure == "CIS" and (entity.age is None or entity.age > 2):
-                continue
-            if measure.startswith("CDC") and not getattr(entity, "conditions", None):
-                # Only for diabetics
-                continue
-
-            if rng.random() < probability:
-                gaps.append(measure)
-
-        return gaps
+        # Only eligible measures draw from rng
+        return [
+            measure
+            for (measure, probability), is_eligible in zip(_QUALITY_GAP_MEASURES, eligible)
+            if is_eligible and rng.random() < probability
+        ]
 
     def _validate(
         self,
@@ -373,3 +441,17 @@ class MemberProfileExecutor:
             warnings=warnings,
             errors=errors,
         )
+
+
+def _generate_member_range(
+    executor: MemberProfileExecutor,
+    start: int,
+    stop: int,
+    today: date,
+) -> list[GeneratedMember]:
+    """Generate members [start, stop) in an execute_parallel() worker."""
+    core_executor = executor._core_executor
+    return [
+        executor._extend_to_member(core_executor._generate_entity(i), today)
+        for i in range(start, stop)
+    ]
@@ -19,6 +19,7 @@ from membersim.generation.executor import (
 from membersim.generation.profiles import MemberProfileSpecification
 from membersim.generation.templates import (
     MEMBER_PROFILE_TEMPLATES,
+    _lookup_template,
     get_template,
     list_templates,
 )
@@ -93,14 +94,14 @@ def generate(
         KeyError: If template name not found
         ValueError: If profile specification is invalid
     """
-    # Resolve template if string
+    # Resolve template if string. The executor only reads the spec, so the
+    # template or caller's spec is used as-is unless overrides need a copy
     if isinstance(profile, str):
-        spec = get_template(profile)
+        spec = _lookup_template(profile)
     else:
-        # Make a copy to avoid modifying original
-        spec = MemberProfileSpecification.model_validate(profile.model_dump())
+        spec = profile
 
-    # Apply overrides
+    # Apply overrides to a dumped copy
     if overrides:
         spec_data = spec.model_dump()
         _apply_overrides(spec_data, overrides)
@@ -328,16 +328,24 @@ def get_template(name: str) -> MemberProfileSpecification:
     Returns:
         Copy of the template specification
 
+    Raises:
+        KeyError: If template not found
+    """
+    # Return a copy to prevent modification of template
+    template = _lookup_template(name)
+    return MemberProfileSpecification.model_validate(template.model_dump())
+
+
+def _lookup_template(name: str) -> MemberProfileSpecification:
+    """Get the shared template instance for read-only use.
+
     Raises:
         KeyError: If template not found
     """
     if name not in MEMBER_PROFILE_TEMPLATES:
         available = ", ".join(sorted(MEMBER_PROFILE_TEMPLATES.keys()))
         raise KeyError(f"Unknown template '{name}'. Available: {available}")
-
-    # Return a copy to prevent modification of template
-    template = MEMBER_PROFILE_TEMPLATES[name]
-    return MemberProfileSpecification.model_validate(template.model_dump())
+    return MEMBER_PROFILE_TEMPLATES[name]
 
 
 def list_templates() -> list[dict[str, str]]:
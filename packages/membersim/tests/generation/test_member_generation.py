@@ -20,6 +20,7 @@ from membersim.generation import (
     MemberGenerationSpec,
     PlanDistributionSpec,
 )
+from healthsim.generation.profile_executor import PARALLEL_MIN_COUNT
 from healthsim.generation.profile_schema import (
     DemographicsSpec,
     DistributionSpec,
@@ -162,6 +163,23 @@ class TestMemberProfileExecutor:
         assert result.plan_distribution["PPO"] > 30
         assert result.plan_distribution["HMO"] > 30
 
+    def test_execute_zero_weight_plan_never_chosen(self):
+        """Test plans with zero weight are never sampled."""
+        spec = MemberProfileSpecification(
+            id="plan-test",
+            name="Plan Test",
+            coverage=MemberCoverageSpec(
+                plan_distribution=PlanDistributionSpec(
+                    weights={"PPO": 0.25, "HMO": 0.0, "EPO": 0.75}
+                ),
+            ),
+            generation=MemberGenerationSpec(count=200),
+        )
+        result = MemberProfileExecutor(spec, seed=42).execute()
+
+        assert "HMO" not in result.plan_distribution
+        assert set(result.plan_distribution) == {"PPO", "EPO"}
+
     def test_execute_reproducible(self):
         """Test reproducibility with same seed."""
         spec = MemberProfileSpecification(
@@ -201,6 +219,28 @@ class TestMemberProfileExecutor:
 
         assert result.count == 25
 
+    def test_execute_parallel_matches_execute(self):
+        """Test parallel execution generates the same members as execute()."""
+        executor = MemberProfileExecutor(get_template("medicare-advantage-diabetic"), seed=42)
+
+        serial = executor.execute(count_override=PARALLEL_MIN_COUNT)
+        parallel = executor.execute_parallel(max_workers=2, count_override=PARALLEL_MIN_COUNT)
+
+        assert parallel.members == serial.members
+        assert parallel.plan_distribution == serial.plan_distribution
+
+    def test_execute_parallel_small_batch_in_process(self):
+        """Test batches below the threshold are generated without a worker pool."""
+        spec = MemberProfileSpecification(
+            id="parallel-test",
+            name="Parallel Test",
+            generation=MemberGenerationSpec(count=25),
+        )
+        executor = MemberProfileExecutor(spec, seed=42)
+        result = executor.execute_parallel(max_workers=4)
+
+        assert result.members == executor.execute().members
+
     def test_generated_member_has_required_fields(self):
         """Test generated members have required fields."""
         spec = MemberProfileSpecification(
@@ -292,6 +332,18 @@ class TestGenerate:
         )
         assert result.count == 10
 
+    def test_generate_overrides_leave_template_unchanged(self):
+        """Test overrides apply to a copy, not the shared template."""
+        generate(
+            "commercial-ppo-healthy",
+            count=5,
+            seed=42,
+            **{"coverage.plan_distribution.weights": {"HMO": 1.0}},
+        )
+
+        template = MEMBER_PROFILE_TEMPLATES["commercial-ppo-healthy"]
+        assert "HMO" not in template.coverage.plan_distribution.weights
+
     def test_generate_reproducible(self):
         """Test generate reproducibility."""
         result1 = generate("commercial-ppo-healthy", count=10, seed=42)
@@ -3,6 +3,7 @@
 from datetime import date, timedelta
 
 from membersim import Member
+from membersim.generation.executor import GeneratedMember
 from membersim.journeys import (
     # Core classes
     JourneyEngine,
@@ -242,6 +243,34 @@ class TestJourneyEngine:
         dates = [e.scheduled_date for e in timeline.events]
         assert dates == sorted(dates), "Events should be in chronological order"
 
+    def test_generated_member_conditions(self) -> None:
+        """Test conditions see fields GeneratedMember inherits from GeneratedEntity."""
+        engine = create_member_journey_engine(seed=42)
+        journey = JourneySpecification(
+            journey_id="senior-outreach",
+            name="Senior Outreach",
+            events=[
+                EventDefinition(
+                    event_id="outreach",
+                    name="Senior Outreach",
+                    event_type="care_management_outreach",
+                    conditions=[
+                        EventCondition(field="entity.age", operator="gte", value=65)
+                    ],
+                )
+            ],
+        )
+        member = GeneratedMember(index=0, seed=1, age=70, member_id="M003")
+
+        timeline = engine.create_timeline(
+            entity=member,
+            entity_type="member",
+            journey=journey,
+            start_date=date(2024, 1, 1),
+        )
+
+        assert len(timeline.events) == 1
+
 
 class TestTimeline:
     """Test timeline functionality."""